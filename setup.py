@@ -29,6 +29,7 @@ setuptools.setup(
         "slxpy.frontend",
         "slxpy.backend",
         "slxpy.cli",
+        "slxpy.runtime",
     ],
     package_data={"slxpy": package_data},
     install_requires=[
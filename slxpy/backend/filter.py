@@ -1,5 +1,8 @@
+from types import SimpleNamespace
+
 import jinja2
 
+from slxpy.common.enum import FieldMode
 from slxpy.common.mapping import simulink_mapping
 
 
@@ -15,3 +18,10 @@ def add_filters(env: jinja2.Environment):
     env.filters["field_desc"] = field_desc
     env.filters["select_struct"] = lambda label: [s for s in label if not s.is_enum]
     env.filters["select_enum"] = lambda label: [s for s in label if s.is_enum]
+
+    def stack(field, k: int):
+        # Layout of k stacked frames of a plain (array) field, for the shape macros of templates
+        shape = [k, *(field.shape if field.mode == FieldMode.PLAIN_ARRAY else [1])]
+        return SimpleNamespace(name=field.name, mode=FieldMode.PLAIN_ARRAY, shape=shape, size=k * field.size)
+
+    env.filters["stack"] = stack
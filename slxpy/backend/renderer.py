@@ -34,7 +34,21 @@ assets: List[AssetInfo] = [
     AssetInfo(name="test_extension.py", template="test_extension.py.jinja", overwrite=False),
 ]
 
-includes = ["common.h", "bind.h", "complex.h", "data.h", "simulink_builtin.h", "env.h"]
+includes = [
+    "common.h",
+    "bind.h",
+    "complex.h",
+    "data.h",
+    "simulink_builtin.h",
+    "env.h",
+    "thread_pool.h",
+    "snapshot.h",
+    "pickle.h",
+    "normalize.h",
+    "random.h",
+    "perf.h",
+    "trace.h",
+]
 
 
 def render(workdir: Path, debug: bool = False):
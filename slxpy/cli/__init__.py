@@ -35,19 +35,25 @@ def entry_point():
 
 
 def _register_cli_commands(app: click.Group):
+    from slxpy.cli.bench import bench
     from slxpy.cli.clean import clean
     from slxpy.cli.generate import backend, frontend, generate
     from slxpy.cli.init import init
     from slxpy.cli.multi_build import multi_build
     from slxpy.cli.pack import pack
+    from slxpy.cli.serve import serve
+    from slxpy.cli.synthetic import synthetic
 
     app.add_command(init)
+    app.add_command(synthetic)
     app.add_command(frontend)
     app.add_command(backend)
     app.add_command(generate)
     app.add_command(multi_build)
     app.add_command(clean)
     app.add_command(pack)
+    app.add_command(serve)
+    app.add_command(bench)
 
 
 _register_cli_commands(app)
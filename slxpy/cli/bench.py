@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+import click
+
+from slxpy.cli.utils import get_plat_specifier
+
+
+@click.command()
+@click.argument("module")
+@click.option(
+    "--batch-sizes",
+    "-b",
+    default="1,16,256,4096",
+    show_default=True,
+    help="Comma separated batch sizes of vectorized envs.",
+)
+@click.option("--steps", "-s", default=20000, show_default=True, help="Env steps per measurement.")
+@click.option("--num-threads", "-t", default=None, type=int, help="Worker threads of parallel vectorized envs.")
+@click.option(
+    "--path",
+    "-p",
+    "paths",
+    multiple=True,
+    type=click.Path(file_okay=False, exists=True, resolve_path=True, path_type=Path),
+    help="Extra directory to import the module from. [default: build output of workdir]",
+)
+@click.pass_context
+def bench(
+    ctx: click.Context,
+    module: str,
+    batch_sizes: str,
+    steps: int,
+    num_threads: Optional[int],
+    paths: Tuple[Path, ...],
+):
+    """
+    Benchmark steps/sec of a built extension.
+    Single env, serial and parallel vectorized envs at each batch size.
+    """
+    workdir: Path = ctx.obj["workdir"]
+    if not paths:
+        libdir = workdir / "build" / f"lib{get_plat_specifier()}"
+        paths = (libdir,) if libdir.exists() else (workdir,)
+    sys.path[:0] = [str(p) for p in paths]
+
+    from slxpy.runtime.benchmark import format_results, run
+
+    sizes = [int(b) for b in batch_sizes.split(",")]
+    click.echo(format_results(run(module, sizes, steps, num_threads)))
@@ -49,6 +49,14 @@ def run_in_conda_env(env_name: str, cwd: str, args: List[str]):
     run_conda_command(args)
 
 
+def run_in_conda_env_captured(env_name: str, cwd: str, args: List[str]) -> subprocess.CompletedProcess:
+    """
+    Like run_in_conda_env, but collect stdout and stderr as text and leave the return code to the caller.
+    """
+    args = [get_conda_executable(), "run", "--name", env_name, "--no-capture-output", "--cwd", cwd, *args]
+    return subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+
+
 def get_conda_executable():
     return os.environ["CONDA_EXE"]
 
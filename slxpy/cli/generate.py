@@ -1,5 +1,6 @@
 import textwrap
 from pathlib import Path
+from typing import Optional
 
 import click
 
@@ -42,8 +43,15 @@ def backend(ctx: click.Context):
 
 @click.command()
 @click.option("--build", is_flag=True, help="Also build the project.")
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel compile jobs of the build. [default: SLXPY_BUILD_JOBS, or all CPUs]",
+)
 @click.pass_context
-def generate(ctx: click.Context, build: bool):
+def generate(ctx: click.Context, build: bool, jobs: Optional[int]):
     """
     Execute slxpy frontend and backend.
     Produce a self-contained, portable source project.
@@ -58,6 +66,8 @@ def generate(ctx: click.Context, build: bool):
         import sys
 
         args = [sys.executable, "setup.py", "build"]
+        if jobs is not None:
+            args += ["-j", str(jobs)]
         # fmt: off
         click.echo(f"Run \"{' '.join(args)}\" to build extension.")
         # fmt: on
@@ -1,6 +1,9 @@
+import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 import click
 
@@ -10,6 +13,7 @@ from slxpy.cli.conda import (
     get_conda_env_set,
     remove_conda_env,
     run_in_conda_env,
+    run_in_conda_env_captured,
 )
 from slxpy.cli.utils import ensure_slxpy_project, get_plat_name, get_plat_specifier
 
@@ -98,10 +102,33 @@ def clean(versions: Tuple[str, ...]):
     help="Folder to aggregate build results into. [default: {workdir}/build/slxpy{plat}]",
 )
 @click.option("--aggregate/--no-aggregate", default=True, show_default=True, help="Aggregate build results or not.")
+@click.option(
+    "--share-model/--no-share-model",
+    default=True,
+    show_default=True,
+    help="Compile model sources once and link them into every Python version's build.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Python versions built concurrently. [default: number of versions, at most CPU count]",
+)
 @click.pass_context
-def run(ctx: click.Context, versions: Tuple[str, ...], aggregate_output: Path, aggregate: bool):
+def run(
+    ctx: click.Context,
+    versions: Tuple[str, ...],
+    aggregate_output: Path,
+    aggregate: bool,
+    share_model: bool,
+    jobs: Optional[int],
+):
     """
     Build project for multiple Python versions.
+
+    With --share-model, model sources are compiled once into build/model.{plat} (in the first version's
+    environment), then each version only compiles module.cc and links the shared objects.
     """
     workdir: Path = ctx.obj["workdir"]
     ensure_slxpy_project(workdir)
@@ -114,10 +141,18 @@ def run(ctx: click.Context, versions: Tuple[str, ...], aggregate_output: Path, a
         raise click.BadParameter(
             f'Missing environments: {target_envs - envs}, please run "slxpy multi-build setup" first.'
         )
-    for version in versions:  # Not using target_envs as set is not ordered.
-        env_name = _get_env_name(version)
-        click.secho(f"Building project in {env_name}.", fg="green")
-        run_in_conda_env(env_name, workdir, ["python", "setup.py", "build_ext"])
+    args = ["python", "setup.py", "build_ext"]
+    if share_model:
+        model_objects = str(Path("build") / f"model.{get_plat_name()}")
+        args += ["--model-objects", model_objects]
+        env_name = _get_env_name(versions[0])
+        click.secho(f"Compiling model sources into {model_objects} in {env_name}.", fg="green")
+        begin = time.perf_counter()
+        run_in_conda_env(env_name, workdir, [*args, "--model-only"])
+        click.secho(f"Model compiled in {time.perf_counter() - begin:.1f}s.", fg="green")
+    if jobs is None:
+        jobs = min(len(versions), os.cpu_count() or 1)
+    _build_versions(workdir, versions, args, jobs)
 
     if aggregate:
         if aggregate_output is None:
@@ -132,6 +167,37 @@ def run(ctx: click.Context, versions: Tuple[str, ...], aggregate_output: Path, a
             shutil.copytree(build_dir, aggregate_output, dirs_exist_ok=True)
 
 
+def _build_versions(workdir: Path, versions: Tuple[str, ...], args: List[str], jobs: int):
+    if jobs == 1:
+        for version in versions:  # Not using target_envs as set is not ordered.
+            env_name = _get_env_name(version)
+            click.secho(f"Building project in {env_name}.", fg="green")
+            run_in_conda_env(env_name, workdir, args)
+        return
+
+    def build(version: str):
+        begin = time.perf_counter()
+        cp = run_in_conda_env_captured(_get_env_name(version), workdir, args)
+        return cp, time.perf_counter() - begin
+
+    click.secho(f"Building project for Python {', '.join(versions)} with {jobs} concurrent jobs.", fg="green")
+    with ThreadPoolExecutor(jobs) as pool:
+        futures = [pool.submit(build, version) for version in versions]
+        failed = []
+        # Output is printed per version in the given order, whichever build finishes first
+        for version, future in zip(versions, futures):
+            cp, elapsed = future.result()
+            env_name = _get_env_name(version)
+            ok = cp.returncode == 0
+            click.secho(f"Building project in {env_name}.", fg="green")
+            click.echo(cp.stdout, nl=False)
+            click.secho(f"{env_name} {'finished' if ok else 'FAILED'} in {elapsed:.1f}s.", fg="green" if ok else "red")
+            if not ok:
+                failed.append(env_name)
+    if failed:
+        raise click.ClickException(f"Build failed in {', '.join(failed)}.")
+
+
 def _validate_python_version(version_str: str):
     from packaging.version import Version
     from packaging.version import parse as parse_version
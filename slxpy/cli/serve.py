@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+import click
+
+from slxpy.cli.utils import get_plat_specifier
+
+
+@click.command()
+@click.argument("module")
+@click.option("--num-envs", "-n", default=64, show_default=True, help="Total number of envs hosted by the server.")
+@click.option(
+    "--address",
+    "-a",
+    default="tcp:127.0.0.1:5555",
+    show_default=True,
+    help='Address to listen on, "unix:PATH" or "tcp:HOST:PORT".',
+)
+@click.option("--num-threads", "-t", default=None, type=int, help="Worker threads of the vectorized env.")
+@click.option("--batch-wait", default=0.0, show_default=True, help="Seconds to wait for more clients to join a batch.")
+@click.option(
+    "--path",
+    "-p",
+    "paths",
+    multiple=True,
+    type=click.Path(file_okay=False, exists=True, resolve_path=True, path_type=Path),
+    help="Extra directory to import the module from. [default: build output of workdir]",
+)
+@click.pass_context
+def serve(
+    ctx: click.Context,
+    module: str,
+    num_envs: int,
+    address: str,
+    num_threads: Optional[int],
+    batch_wait: float,
+    paths: Tuple[Path, ...],
+):
+    """
+    Serve a built extension's GymEnvVec to client processes.
+    """
+    workdir: Path = ctx.obj["workdir"]
+    if not paths:
+        libdir = workdir / "build" / f"lib{get_plat_specifier()}"
+        paths = (libdir,) if libdir.exists() else (workdir,)
+    sys.path[:0] = [str(p) for p in paths]
+
+    from slxpy.runtime.server import EnvServer
+
+    env_kwargs = {} if num_threads is None else {"num_threads": num_threads}
+    server = EnvServer(module, num_envs, address, env_kwargs=env_kwargs, batch_wait=batch_wait)
+    click.secho(f"Serving {num_envs} {module} envs on {address}, press Ctrl+C to stop.", fg="green")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
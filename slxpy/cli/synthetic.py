@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import click
+
+
+@click.command()
+@click.option("--name", default="synthetic", show_default=True, help="Model name, also the extension module name.")
+@click.option("--obs-size", default=8, show_default=True, help="Observation size.")
+@click.option("--act-size", default=2, show_default=True, help="Action size.")
+@click.option("--state-size", default=16, show_default=True, help="Discrete state size.")
+@click.option("--param-size", default=4, show_default=True, help="Size of the array instance parameter.")
+@click.option("--compute-cost", default=1, show_default=True, help="Iterations of a scalar sin per state element each step.")
+@click.option("--episode-length", default=1000, show_default=True, help="Steps until an episode terminates, 0 for never.")
+@click.pass_context
+def synthetic(
+    ctx: click.Context,
+    name: str,
+    obs_size: int,
+    act_size: int,
+    state_size: int,
+    param_size: int,
+    compute_cost: int,
+    episode_length: int,
+):
+    """
+    Initialize slxpy working directory with a synthetic model.
+    Sources and metadata stand in for Simulink output, so the project builds without MATLAB.
+    """
+    workdir: Path = ctx.obj["workdir"]
+
+    from slxpy.frontend.synthetic import SyntheticConfig, generate_synthetic
+
+    config = SyntheticConfig(name, obs_size, act_size, state_size, param_size, compute_cost, episode_length)
+    generate_synthetic(workdir, config)
+    click.echo(f"Generated synthetic model {name}, run `slxpy generate --build` to build it.")
@@ -6,3 +6,5 @@ metadata_version = "1.0.0"
 metadata_name = "metadata.json"
 model_dir = "model"
 project_ir_name = "ir.json"
+
+state_version = 3  # Bump when the binary layout of pickled env state changes
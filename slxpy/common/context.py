@@ -1,3 +1,4 @@
+import hashlib
 import json
 from collections.abc import Sequence
 from dataclasses import dataclass, field, fields
@@ -336,6 +337,52 @@ class Module:
             env=EnvConfig.reconstruct(d["env"]),
         )
 
+    @cached_property
+    def plain_field_paths(self) -> List[Tuple[str, Field]]:
+        """
+        Plain (array) fields reachable from the model class, as dotted paths through model and struct fields.
+        """
+        return self._field_paths((FieldMode.PLAIN, FieldMode.PLAIN_ARRAY))
+
+    @cached_property
+    def pointer_field_paths(self) -> List[Tuple[str, Field]]:
+        """
+        Pointer (array) fields reachable from the model class, relocated when a model state is restored elsewhere.
+        """
+        return self._field_paths((FieldMode.POINTER, FieldMode.POINTER_ARRAY))
+
+    def _field_paths(self, modes: Tuple[FieldMode, ...]) -> List[Tuple[str, Field]]:
+        mc = self.model_class
+        model_types = {v: mc.type_mapping[k] for k, v in mc.field_mapping.items() if k in mc.type_mapping}
+        paths: List[Tuple[str, Field]] = []
+
+        def visit(fields: List[Field], prefix: str):
+            for f in fields:
+                if f.mode in modes:
+                    paths.append((prefix + f.name, f))
+                elif f.mode == FieldMode.STRUCT or (f.mode == FieldMode.MODEL and f.name in model_types):
+                    type = self.types.lookup(f.type if f.mode == FieldMode.STRUCT else model_types[f.name])
+                    if not type.is_enum:
+                        visit(type.fields, f"{prefix}{f.name}.")
+
+        visit(mc.fields, "")
+        return paths
+
+    @cached_property
+    def layout_hash(self) -> str:
+        """
+        Hash of model class and struct layouts, as 16 hex digits.
+        Pickled state carries it, so an extension built from a different model refuses to load it.
+        """
+        dict_filter: Callable[[dict], dict] = lambda x: {k: v for k, v in x.items() if k != "doc"}
+        layout = {
+            "state_version": C.state_version,
+            "model_class": self.model_class.asdict(dict_filter),
+            "types": self.types.asdicts(dict_filter),
+        }
+        text = json.dumps(layout, sort_keys=True)
+        return hashlib.sha256(text.encode()).hexdigest()[:16]
+
     def asdict(self, dict_filter):
         d = {
             "name": self.name,
@@ -28,6 +28,7 @@ class GymConfig:
     observation_space: SpaceConfig
     reward_range: Tuple[Union[float, str], Union[float, str]]
     type_coercion: bool
+    frame_stack: int
 
     @staticmethod
     def reconstruct(d: dict):
@@ -45,6 +46,7 @@ class GymConfig:
             observation_space=SpaceConfig.reconstruct(d["observation_space"]),
             reward_range=reward_range,
             type_coercion=d.get("type_coercion", False),
+            frame_stack=d.get("frame_stack", 1),
         )
 
     def asdict(self, dict_filter):
@@ -58,6 +60,7 @@ class GymConfig:
             "observation_space": self.observation_space.asdict(dict_filter),
             "reward_range": self.reward_range,
             "type_coercion": self.type_coercion,
+            "frame_stack": self.frame_stack,
         }
         assert len(d) == len(fields(self))  # Ensure no left-out
         return dict_filter(d)
@@ -79,7 +82,7 @@ class GymConfig:
     @staticmethod
     def default():
         return GymConfig(
-            None, None, None, None, True, SpaceConfig.default(), SpaceConfig.default(), ("-inf", "inf"), True
+            None, None, None, None, True, SpaceConfig.default(), SpaceConfig.default(), ("-inf", "inf"), True, 1
         )
 
 
@@ -120,8 +123,13 @@ class Config:
     use_raw: bool
     use_gym: bool
     use_rng: bool
+    rng_engine: str
     use_vec: bool
     vec_parallel: bool
+    vec_num_threads: int
+    vec_grain_size: int
+    release_gil: bool
+    perf_counters: bool
     gym: Optional[GymConfig]
     reset: Optional[ResetConfig]
     parameter: Dict[str, InitConfig]
@@ -146,8 +154,13 @@ class Config:
             use_raw=d["use_raw"],
             use_gym=use_gym,
             use_rng=d["use_rng"],
+            rng_engine=d.get("rng_engine", "mt19937"),
             use_vec=d["use_vec"],
             vec_parallel=d["vec_parallel"],
+            vec_num_threads=d.get("vec_num_threads", 0),
+            vec_grain_size=d.get("vec_grain_size", 0),
+            release_gil=d.get("release_gil", True),
+            perf_counters=d.get("perf_counters", False),
             gym=gym_config,
             reset=reset_config,
             parameter={k: InitConfig.reconstruct(v) for k, v in parameter_dict.items()},
@@ -158,8 +171,13 @@ class Config:
             "use_raw": self.use_raw,
             "use_gym": self.use_gym,
             "use_rng": self.use_rng,
+            "rng_engine": self.rng_engine,
             "use_vec": self.use_vec,
             "vec_parallel": self.vec_parallel,
+            "vec_num_threads": self.vec_num_threads,
+            "vec_grain_size": self.vec_grain_size,
+            "release_gil": self.release_gil,
+            "perf_counters": self.perf_counters,
             "gym": self.gym.asdict(dict_filter) if self.use_gym else None,
             "reset": self.reset.asdict(dict_filter),
             "parameter": {k: v.asdict(dict_filter) for k, v in self.parameter.items()},
@@ -179,8 +197,13 @@ class Config:
             use_raw=True,
             use_gym=True,
             use_rng=True,
+            rng_engine="mt19937",
             use_vec=True,
             vec_parallel=False,
+            vec_num_threads=0,
+            vec_grain_size=0,
+            release_gil=True,
+            perf_counters=False,
             gym=GymConfig.default(),
             reset=ResetConfig.default(),
             parameter={},
@@ -190,6 +213,8 @@ class Config:
         if not self.use_gym and not self.use_raw:
             return
 
+        assert self.rng_engine in ("mt19937", "pcg32", "philox"), "rng_engine must be one of 'mt19937', 'pcg32', 'philox'"
+
         # NOTE: The following 3 checks are technically unnecessary
         # But they are here to make sure that the user is aware of
         # correctness of environment configuration.
@@ -227,6 +252,8 @@ class Config:
             assert self.gym.reward_key is None or self.gym.reward_key in obs_type.field_dict
             assert self.gym.done_key is None or self.gym.done_key in obs_type.field_dict
 
+            assert isinstance(self.gym.frame_stack, int) and self.gym.frame_stack >= 1, "frame_stack must be a positive integer"
+
             if isinstance(self.gym.info, list):
                 for s in self.gym.info:
                     assert s in obs_type.field_dict
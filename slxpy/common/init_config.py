@@ -1,5 +1,5 @@
 from dataclasses import dataclass, fields
-from typing import TYPE_CHECKING, ClassVar, Dict, List, Literal, Type, Union
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Literal, Optional, Type, Union
 
 import numpy as np
 
@@ -18,9 +18,23 @@ def check_shape(array_like, shape: List[int]):
         assert array.size == size, "Size inconsistency, broadcast is currently unsupported."
 
 
+def check_value(value, field: "Field"):
+    """Check a scalar, or a per-element vector for array fields, of finite numbers."""
+    if field.mode == FieldMode.PLAIN_ARRAY:
+        if isinstance(value, list):
+            assert len(value) == np.prod(field.shape).item(), "Expect a number or one value per element."
+        else:
+            assert isinstance(value, (int, float)), "Expect a number or one value per element."
+    else:
+        assert isinstance(value, (int, float)), "Expect a number for a scalar parameter."
+    assert np.all(np.isfinite(value)), "Expect finite values."
+
+
 @dataclass
 class InitConfig:
-    type: Literal["seed", "constant", "uniform", "custom"]
+    type: Literal[
+        "seed", "constant", "uniform", "normal", "truncated_normal", "log_uniform", "choice", "multivariate_normal", "custom"
+    ]
 
     init_name: ClassVar[str] = ""
     mapping: ClassVar[Dict[str, Type["InitConfig"]]] = {}
@@ -96,6 +110,156 @@ class UniformInitConfig(InitConfig):
             assert isinstance(low, float) and isinstance(high, float)
 
 
+@dataclass
+class NormalInitConfig(InitConfig):
+    mean: Union[float, List[float]]
+    std: Union[float, List[float]]
+    init_name: ClassVar[str] = "normal"
+
+    @staticmethod
+    def reconstruct(d: dict):
+        return NormalInitConfig(type=d["type"], mean=d["mean"], std=d["std"])
+
+    def asdict(self, dict_filter):
+        d = {"type": self.type, "mean": self.mean, "std": self.std}
+        assert len(d) == len(fields(self))  # Ensure no left-out
+        return dict_filter(d)
+
+    def check_basic_compatibility(self, field: "Field"):
+        super().check_basic_compatibility(field)
+        check_value(self.mean, field)
+        check_value(self.std, field)
+        assert np.all(np.array(self.std) >= 0), "std must be non-negative."
+
+
+@dataclass
+class TruncatedNormalInitConfig(InitConfig):
+    mean: Union[float, List[float]]
+    std: Union[float, List[float]]
+    low: Union[float, List[float]]
+    high: Union[float, List[float]]
+    init_name: ClassVar[str] = "truncated_normal"
+
+    @staticmethod
+    def reconstruct(d: dict):
+        return TruncatedNormalInitConfig(type=d["type"], mean=d["mean"], std=d["std"], low=d["low"], high=d["high"])
+
+    def asdict(self, dict_filter):
+        d = {"type": self.type, "mean": self.mean, "std": self.std, "low": self.low, "high": self.high}
+        assert len(d) == len(fields(self))  # Ensure no left-out
+        return dict_filter(d)
+
+    def check_basic_compatibility(self, field: "Field"):
+        super().check_basic_compatibility(field)
+        for value in (self.mean, self.std, self.low, self.high):
+            check_value(value, field)
+        assert np.all(np.array(self.std) > 0), "std must be positive."
+        assert np.all(np.array(self.low) < np.array(self.high)), "low must be less than high."
+
+
+@dataclass
+class LogUniformInitConfig(InitConfig):
+    low: Union[float, List[float]]
+    high: Union[float, List[float]]
+    init_name: ClassVar[str] = "log_uniform"
+
+    @staticmethod
+    def reconstruct(d: dict):
+        return LogUniformInitConfig(type=d["type"], low=d["low"], high=d["high"])
+
+    def asdict(self, dict_filter):
+        d = {"type": self.type, "low": self.low, "high": self.high}
+        assert len(d) == len(fields(self))  # Ensure no left-out
+        return dict_filter(d)
+
+    def check_basic_compatibility(self, field: "Field"):
+        super().check_basic_compatibility(field)
+        check_value(self.low, field)
+        check_value(self.high, field)
+        assert np.all(np.array(self.low) > 0), "low must be positive."
+        assert np.all(np.array(self.low) <= np.array(self.high)), "low must not exceed high."
+
+    @property
+    def log_low(self):
+        return np.log(self.low).tolist()
+
+    @property
+    def log_high(self):
+        return np.log(self.high).tolist()
+
+
+@dataclass
+class ChoiceInitConfig(InitConfig):
+    values: List[Union[float, List[float]]]
+    weights: Optional[List[float]]
+    init_name: ClassVar[str] = "choice"
+
+    @staticmethod
+    def reconstruct(d: dict):
+        return ChoiceInitConfig(type=d["type"], values=d["values"], weights=d.get("weights", None))
+
+    def asdict(self, dict_filter):
+        d = {"type": self.type, "values": self.values, "weights": self.weights}
+        assert len(d) == len(fields(self))  # Ensure no left-out
+        return dict_filter(d)
+
+    def check_basic_compatibility(self, field: "Field"):
+        super().check_basic_compatibility(field)
+        assert len(self.values) > 0, "Expect at least one value to choose from."
+        for value in self.values:
+            check_value(value, field)
+        if self.weights is not None:
+            weights = np.array(self.weights, dtype=np.float64)
+            assert weights.shape == (len(self.values),), "Expect one weight per value."
+            assert np.all(weights >= 0) and weights.sum() > 0, "Weights must be non-negative and not all zero."
+
+    @property
+    def cumulative_weights(self):
+        """Normalized cumulative weights, None for equally likely values."""
+        if self.weights is None:
+            return None
+        cumulative = np.cumsum(self.weights, dtype=np.float64)
+        cumulative /= cumulative[-1]
+        cumulative[-1] = 1.0
+        return cumulative.tolist()
+
+
+@dataclass
+class MultivariateNormalInitConfig(InitConfig):
+    mean: Union[float, List[float]]
+    cov: List[List[float]]
+    init_name: ClassVar[str] = "multivariate_normal"
+
+    @staticmethod
+    def reconstruct(d: dict):
+        return MultivariateNormalInitConfig(type=d["type"], mean=d["mean"], cov=d["cov"])
+
+    def asdict(self, dict_filter):
+        d = {"type": self.type, "mean": self.mean, "cov": self.cov}
+        assert len(d) == len(fields(self))  # Ensure no left-out
+        return dict_filter(d)
+
+    def check_basic_compatibility(self, field: "Field"):
+        super().check_basic_compatibility(field)
+        if field.mode != FieldMode.PLAIN_ARRAY:
+            raise ValueError('For scalar parameters, use "normal" type initialization.')
+        check_value(self.mean, field)
+        size = np.prod(field.shape).item()
+        cov = np.array(self.cov, dtype=np.float64)
+        assert cov.shape == (size, size), f"Expect a {size}x{size} covariance matrix."
+        assert np.allclose(cov, cov.T), "Covariance matrix must be symmetric."
+        try:
+            np.linalg.cholesky(cov)
+        except np.linalg.LinAlgError:
+            raise ValueError("Covariance matrix must be positive definite.") from None
+
+    @property
+    def cholesky(self):
+        """Lower Cholesky factor of cov, packed row by row."""
+        factor = np.linalg.cholesky(np.array(self.cov, dtype=np.float64))
+        return factor[np.tril_indices(factor.shape[0])].tolist()
+
+
 @dataclass
 class CustomInitConfig(InitConfig):
     code: str
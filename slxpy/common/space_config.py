@@ -68,12 +68,17 @@ class BoxSpaceConfig(SpaceConfig):
     def func(self):
         return f"make_box<{dtype_mapping[self.dtype.name]}>"
 
+    @property
+    def native(self):
+        return f"Box<{dtype_mapping[self.dtype.name]}>"
+
 
 @dataclass
 class DiscreteSpaceConfig(SpaceConfig):
     n: int
     init_name: ClassVar[str] = "Discrete"
     func: ClassVar[str] = "make_discrete"
+    native: ClassVar[str] = "Discrete"
     ctype: ClassVar[str] = "int64_t"
 
     @staticmethod
@@ -95,6 +100,7 @@ class MultiDiscreteSpaceConfig(SpaceConfig):
     nvec: List[int]
     init_name: ClassVar[str] = "MultiDiscrete"
     func: ClassVar[str] = "make_multi_discrete"
+    native: ClassVar[str] = "MultiDiscrete"
     ctype: ClassVar[str] = "int64_t"
 
     @staticmethod
@@ -116,6 +122,7 @@ class MultiBinarySpaceConfig(SpaceConfig):
     n: int
     init_name: ClassVar[str] = "MultiBinary"
     func: ClassVar[str] = "make_multi_binary"
+    native: ClassVar[str] = "MultiBinary"
     ctype: ClassVar[str] = "int8_t"
 
     @staticmethod
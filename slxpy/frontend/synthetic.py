@@ -0,0 +1,117 @@
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import slxpy.common.constants as C
+from slxpy.common.env_config import Config as EnvConfig
+from slxpy.common.jinja import create_jinja_env
+from slxpy.common.model_config import Config as ModelConfig
+from slxpy.frontend.init import check_valid_workspace
+
+
+@dataclass
+class SyntheticConfig:
+    """
+    Shape and cost of a synthetic model, standing in for Simulink + Embedded Coder output.
+    """
+
+    name: str = "synthetic"
+    obs_size: int = 8
+    act_size: int = 2
+    state_size: int = 16
+    param_size: int = 4
+    # Iterations of a scalar sin per state element in each step
+    compute_cost: int = 1
+    # Steps until done is raised, 0 -> never
+    episode_length: int = 1000
+    sample_time: float = 0.01
+
+    @property
+    def class_name(self):
+        return f"{self.name}ModelClass"
+
+    def check(self):
+        assert re.match("^[a-zA-Z][a-zA-Z0-9_]*$", self.name), "Model name is not valid."
+        for size in (self.obs_size, self.act_size, self.state_size, self.param_size):
+            assert size >= 1, "Sizes must be positive."
+        assert self.compute_cost >= 0 and self.episode_length >= 0
+        assert self.sample_time > 0
+
+
+def generate_synthetic(workdir: Path, config: SyntheticConfig):
+    """
+    Write a slxpy project for a synthetic model into workdir: model.toml, env.toml,
+    metadata.json and model sources, as if exported by the slxpy MATLAB package.
+    """
+    config.check()
+    check_valid_workspace(workdir)
+    modeldir = workdir / C.model_dir
+    modeldir.mkdir(parents=True, exist_ok=True)
+
+    frontend_env = create_jinja_env("frontend")
+    frontend_env.filters["tf"] = lambda x: "true" if x else "false"
+    model_config = ModelConfig.default(config.name, config.class_name, "")
+    (workdir / C.model_config_name).write_text(
+        frontend_env.get_template(f"{C.model_config_name}.jinja").render(config=model_config)
+    )
+
+    env = create_jinja_env("synthetic")
+    (workdir / C.env_config_name).write_text(
+        env.get_template(f"{C.env_config_name}.jinja").render(config=EnvConfig.default(), c=config)
+    )
+    (modeldir / f"{config.name}.h").write_text(env.get_template("model.h.jinja").render(c=config))
+    (modeldir / f"{config.name}.cpp").write_text(env.get_template("model.cpp.jinja").render(c=config))
+    (modeldir / "rtwtypes.h").write_text(env.get_template("rtwtypes.h.jinja").render(c=config))
+
+    with (workdir / C.metadata_name).open("w") as f:
+        json.dump(make_metadata(config), f, indent=2)
+
+
+def make_metadata(config: SyntheticConfig):
+    def plain(name: str, size: int = 0):
+        if size == 0:
+            return {"name": name, "mode": "plain", "is_array": False}
+        return {"name": name, "mode": "plain", "is_array": True, "shape": [size, 1]}
+
+    def struct(name: str, *fields: dict):
+        return {"name": name, "location": "model_class", "is_enum": False, "fields": list(fields)}
+
+    name = config.name
+    return {
+        "__version__": C.metadata_version,
+        "name": name,
+        "author": "slxpy",
+        "version": "1.0",
+        "description": f"Synthetic model with {config.state_size} states and compute cost {config.compute_cost}",
+        "sample_time": config.sample_time,
+        "model_class": {
+            "name": config.class_name,
+            "namespace": "",
+            "identifier": config.class_name,
+            "methods": [{"name": "initialize"}, {"name": "step"}, {"name": "terminate"}],
+            "fields": [{"name": f"{name}_{suffix}"} for suffix in ("U", "Y", "DW", "InstP")],
+            "field_mapping": {
+                "initialize": "initialize",
+                "step": "step",
+                "terminate": "terminate",
+                "external_inputs": f"{name}_U",
+                "external_outputs": f"{name}_Y",
+                "discrete_states": f"{name}_DW",
+                "instance_parameters": f"{name}_InstP",
+            },
+            "type_mapping": {
+                "external_inputs": f"ExtU_{name}_T",
+                "external_outputs": f"ExtY_{name}_T",
+                "discrete_states": f"DW_{name}_T",
+                "instance_parameters": f"InstP_{name}_T",
+            },
+        },
+        "structs": [
+            struct(f"DW_{name}_T", plain("x", config.state_size), plain("t"), plain("steps")),
+            struct(f"ExtU_{name}_T", plain("act", config.act_size)),
+            struct(f"ExtY_{name}_T", plain("obs", config.obs_size), plain("rew"), plain("done"), plain("t")),
+            struct(f"InstP_{name}_T", plain("seed"), plain("gain"), plain("k", config.param_size)),
+        ],
+        "features": {"scoped_enum": True},
+    }
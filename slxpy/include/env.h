@@ -1,7 +1,10 @@
 #pragma once
 #include <array>
 #include <algorithm>
+#include <cmath>
+#include <numeric>
 #include <optional>
+#include <random>
 #include <fmt/core.h>
 #include <fmt/ranges.h>
 #include <pybind11/pybind11.h>
@@ -9,24 +12,35 @@
 #include <pybind11/stl.h>
 #include <pybind11/operators.h>
 using namespace pybind11::literals;
+#include "random.h"
 
 namespace slxpy::env::space
 {
-    // NOTE: Gym-like, but sampling not implemented
-    // This is deprecated, but kept for reference
-    // Use slxpy::env::gym_space instead
+    // Native counterparts of the gymnasium spaces, with sampling and (batched) contains in C++.
+    // Each space owns a compact rng, seeded with seed(), and samples gymnasium's distributions.
+    using rng_T = slxpy::random::PCG32;
+    using shape_type = std::vector<size_t>;
 
     class Discrete
     {
     public:
-        using value_type = size_t;
+        using value_type = int64_t;
         size_t n;
+        rng_T rng{};
     public:
         Discrete(size_t n): n(n) {}
-        bool contains(size_t x) {
-            return x < n;
+        shape_type sample_shape() const { return {}; }
+        void seed(uint64_t s) { rng.seed(s, 0); }
+        void sample(value_type* out, size_t count) {
+            std::uniform_int_distribution<value_type> dist{ 0, static_cast<value_type>(n) - 1 };
+            for (size_t k = 0; k < count; k++) {
+                out[k] = dist(rng);
+            }
         }
-        std::string repr() {
+        bool contains(const value_type* x) const {
+            return *x >= 0 && static_cast<size_t>(*x) < n;
+        }
+        std::string repr() const {
             return fmt::format("Discrete({})", n);
         }
     };
@@ -37,24 +51,32 @@ namespace slxpy::env::space
     class MultiDiscrete
     {
     public:
-        using value_type = size_t;
+        using value_type = int64_t;
         using container_type = std::vector<size_t>;
         container_type nvec;
+        rng_T rng{};
     public:
         MultiDiscrete(container_type nvec): nvec(nvec) {}
-        bool contains(container_type x) {
-            if (x.size() != nvec.size()) {
-                return false;
+        shape_type sample_shape() const { return { nvec.size() }; }
+        void seed(uint64_t s) { rng.seed(s, 0); }
+        void sample(value_type* out, size_t count) {
+            using dist_T = std::uniform_int_distribution<value_type>; dist_T dist;
+            for (size_t k = 0; k < count; k++) {
+                for (size_t i = 0; i < nvec.size(); i++) {
+                    out[k * nvec.size() + i] = dist(rng, dist_T::param_type{ 0, static_cast<value_type>(nvec[i]) - 1 });
+                }
             }
+        }
+        bool contains(const value_type* x) const {
             for (size_t i = 0; i < nvec.size(); i++)
             {
-                if (x[i] >= nvec[i]) {
+                if (x[i] < 0 || static_cast<size_t>(x[i]) >= nvec[i]) {
                     return false;
                 }
             }
             return true;
         }
-        std::string repr() {
+        std::string repr() const {
             return fmt::format("MultiDiscrete({})", nvec);
         }
     };
@@ -66,29 +88,35 @@ namespace slxpy::env::space
     class MultiBinary
     {
     public:
-        using value_type = bool;
-        using container_type = std::vector<size_t>;
+        using value_type = int8_t;
         size_t n;
+        rng_T rng{};
     public:
         MultiBinary(size_t n): n(n) {}
-        bool contains(container_type x) {
-            if (x.size() != n) {
-                return false;
+        shape_type sample_shape() const { return { n }; }
+        void seed(uint64_t s) { rng.seed(s, 0); }
+        void sample(value_type* out, size_t count) {
+            // One engine draw covers 32 elements
+            const size_t total = count * n;
+            for (size_t i = 0; i < total; i += 32) {
+                uint32_t bits = rng();
+                for (size_t j = i; j < std::min(total, i + 32); j++, bits >>= 1) {
+                    out[j] = static_cast<value_type>(bits & 1u);
+                }
             }
+        }
+        bool contains(const value_type* x) const {
             for (size_t i = 0; i < n; i++)
             {
-                if (x[i] >= 2) {
+                if (x[i] != 0 && x[i] != 1) {
                     return false;
                 }
             }
             return true;
         }
-        std::string repr() {
+        std::string repr() const {
             return fmt::format("MultiBinary({})", n);
         }
-        bool operator==(const MultiBinary& other){
-            return n == other.n;
-        }
     };
     bool operator==(const MultiBinary& lhs, const MultiBinary& rhs){
         return lhs.n == rhs.n;
@@ -99,12 +127,13 @@ namespace slxpy::env::space
     {
     public:
         using value_type = T;
-        using shape_type = std::vector<size_t>;
+        using shape_type = slxpy::env::space::shape_type;
         using container_type = std::vector<T>;
         container_type low;
         container_type high;
         shape_type shape;
         size_t size;
+        rng_T rng{};
     private:
         static size_t get_size(const shape_type& shape) {
             return std::accumulate(shape.begin(), shape.end(), 1ULL, std::multiplies<size_t>());
@@ -112,6 +141,25 @@ namespace slxpy::env::space
         static container_type full(T value, const shape_type& shape) {
             return container_type(get_size(shape), value);
         }
+        // Same distributions as gymnasium: uniform when bounded, shifted exponential when bounded on one side,
+        // standard normal when unbounded. Integer boxes draw uniformly from [low, high].
+        T sample_one(size_t i) {
+            if constexpr (std::is_floating_point_v<T>) {
+                const bool bounded_below = std::isfinite(low[i]), bounded_above = std::isfinite(high[i]);
+                if (bounded_below && bounded_above) {
+                    return static_cast<T>(low[i] + (static_cast<double>(high[i]) - low[i]) * slxpy::random::canonical(rng));
+                } else if (bounded_below) {
+                    return static_cast<T>(low[i] - std::log1p(-slxpy::random::canonical(rng)));
+                } else if (bounded_above) {
+                    return static_cast<T>(high[i] + std::log1p(-slxpy::random::canonical(rng)));
+                } else {
+                    return static_cast<T>(slxpy::random::normal(rng));
+                }
+            } else {
+                using wide_T = std::conditional_t<std::is_signed_v<T>, int64_t, uint64_t>;
+                return static_cast<T>(std::uniform_int_distribution<wide_T>{ low[i], high[i] }(rng));
+            }
+        }
     public:
         Box(T low, T high, shape_type shape): Box(full(low, shape), full(high, shape), shape) {}
         Box(container_type low, T high, shape_type shape): Box(low, full(high, shape), shape) {}
@@ -123,10 +171,27 @@ namespace slxpy::env::space
             }
         }
 
-        bool contains(T* x/* , size_t length */) {
-            // if (length != size) {
-            //     return false;
-            // }
+        // Box of k stacked samples, as gymnasium's batch_space
+        Box stack(size_t k) const {
+            container_type stacked_low, stacked_high;
+            for (size_t j = 0; j < k; j++) {
+                stacked_low.insert(stacked_low.end(), low.begin(), low.end());
+                stacked_high.insert(stacked_high.end(), high.begin(), high.end());
+            }
+            shape_type stacked_shape{ k };
+            stacked_shape.insert(stacked_shape.end(), shape.begin(), shape.end());
+            return Box(stacked_low, stacked_high, stacked_shape);
+        }
+        shape_type sample_shape() const { return shape; }
+        void seed(uint64_t s) { rng.seed(s, 0); }
+        void sample(value_type* out, size_t count) {
+            for (size_t k = 0; k < count; k++) {
+                for (size_t i = 0; i < size; i++) {
+                    out[k * size + i] = sample_one(i);
+                }
+            }
+        }
+        bool contains(const value_type* x) const {
             for (size_t i = 0; i < size; i++)
             {
                 if (x[i] < low[i] || x[i] > high[i]) {
@@ -135,7 +200,7 @@ namespace slxpy::env::space
             }
             return true;
         }
-        std::string repr() {
+        std::string repr() const {
             T min = *std::min_element(low.begin(), low.end());
             T max = *std::max_element(high.begin(), high.end());
             return fmt::format("Box({}, {}, {})", min, max, shape);
@@ -148,12 +213,75 @@ namespace slxpy::env::space
                 std::equal(lhs.high.begin(), lhs.high.end(), rhs.high.begin());
     }
 
+    template <typename S>
+    inline constexpr bool is_box_v = false;
+    template <typename T>
+    inline constexpr bool is_box_v<Box<T>> = true;
+
+    // seed, sample and contains shared by all spaces.
+    // sample() returns one sample, sample(n) an (n, *shape) array.
+    // contains takes one sample or an (n, *shape) batch, for which it returns a boolean array.
+    // Only Box casts its input, discrete spaces contain integer arrays only, like gymnasium.
+    template <typename S>
+    void slxpy_bind_sampling(pybind11::class_<S>& cls) {
+        using value_type = typename S::value_type;
+        using npa = pybind11::array_t<value_type, pybind11::array::c_style | pybind11::array::forcecast>;
+        auto contains = [](const S& self, pybind11::object value) -> pybind11::object {
+            if constexpr (!is_box_v<S>) {
+                const pybind11::array raw = pybind11::array::ensure(value);
+                if (!raw || (raw.dtype().kind() != 'i' && raw.dtype().kind() != 'u')) {
+                    return pybind11::bool_(false);
+                }
+            }
+            const npa x = value.cast<npa>();
+            const shape_type shape = self.sample_shape();
+            const size_t ndim = static_cast<size_t>(x.ndim());
+            const bool batched = ndim == shape.size() + 1;
+            if ((ndim != shape.size() && !batched) || !std::equal(shape.begin(), shape.end(), x.shape() + (batched ? 1 : 0))) {
+                return pybind11::bool_(false);
+            }
+            if (!batched) {
+                return pybind11::bool_(self.contains(x.data()));
+            }
+            const size_t count = static_cast<size_t>(x.shape(0));
+            const size_t size = std::accumulate(shape.begin(), shape.end(), size_t{ 1 }, std::multiplies<size_t>());
+            pybind11::array_t<bool> result{ static_cast<pybind11::ssize_t>(count) };
+            bool* result_buf = result.mutable_data();
+            for (size_t k = 0; k < count; k++) {
+                result_buf[k] = self.contains(x.data() + k * size);
+            }
+            return std::move(result);
+        };
+        cls
+            .def("seed", [](S& self, std::optional<uint64_t> s) {
+                self.seed(s ? *s : std::random_device{}());
+            }, "Seed the sampling rng, from std::random_device if seed is None.", "seed"_a=pybind11::none())
+            .def("sample", [](S& self, std::optional<size_t> n) -> pybind11::object {
+                std::vector<pybind11::ssize_t> shape;
+                if (n) {
+                    shape.push_back(static_cast<pybind11::ssize_t>(*n));
+                }
+                for (size_t d : self.sample_shape()) {
+                    shape.push_back(static_cast<pybind11::ssize_t>(d));
+                }
+                npa result{ shape };
+                self.sample(result.mutable_data(), n.value_or(1));
+                if (result.ndim() == 0) {
+                    return result[pybind11::tuple()];
+                }
+                return std::move(result);
+            }, "Return one sample, or an (n, *shape) array of n samples.", "n"_a=pybind11::none())
+            .def("contains", contains, "x"_a)
+            .def("__contains__", contains);
+        cls.attr("dtype") = pybind11::dtype::of<value_type>();
+    }
+
     void slxpy_bind_space(::pybind11::module_& s) {
         pybind11::class_<Discrete> Discrete_PB(s, "Discrete", pybind11::module_local());
         Discrete_PB
+            .def(pybind11::init<size_t>(), "n"_a)
             .def_readonly("n", &Discrete::n)
-            .def("contains", &Discrete::contains)
-            .def("__contains__", &Discrete::contains)
+            .def_property_readonly("shape", [](const Discrete&) { return pybind11::tuple(); })
             .def("__repr__", &Discrete::repr)
             .def(pybind11::self == pybind11::self)
             .def(pybind11::pickle(
@@ -163,13 +291,13 @@ namespace slxpy::env::space
                     return Discrete(t[0].cast<size_t>());
                 }
             ));
-        Discrete_PB.attr("dtype") = pybind11::dtype::of<Discrete::value_type>();
+        slxpy_bind_sampling(Discrete_PB);
 
         pybind11::class_<MultiDiscrete> MultiDiscrete_PB(s, "MultiDiscrete", pybind11::module_local());
         MultiDiscrete_PB
+            .def(pybind11::init<typename MultiDiscrete::container_type>(), "nvec"_a)
             .def_readonly("nvec", &MultiDiscrete::nvec)
-            .def("contains", &MultiDiscrete::contains)
-            .def("__contains__", &MultiDiscrete::contains)
+            .def_property_readonly("shape", [](const MultiDiscrete& self) { return pybind11::make_tuple(self.nvec.size()); })
             .def("__repr__", &MultiDiscrete::repr)
             .def(pybind11::self == pybind11::self)
             .def(pybind11::pickle(
@@ -179,13 +307,13 @@ namespace slxpy::env::space
                     return MultiDiscrete(t[0].cast<typename MultiDiscrete::container_type>());
                 }
             ));
-        MultiDiscrete_PB.attr("dtype") = pybind11::dtype::of<MultiDiscrete::value_type>();
+        slxpy_bind_sampling(MultiDiscrete_PB);
 
         pybind11::class_<MultiBinary> MultiBinary_PB(s, "MultiBinary", pybind11::module_local());
         MultiBinary_PB
+            .def(pybind11::init<size_t>(), "n"_a)
             .def_readonly("n", &MultiBinary::n)
-            .def("contains", &MultiBinary::contains)
-            .def("__contains__", &MultiBinary::contains)
+            .def_property_readonly("shape", [](const MultiBinary& self) { return pybind11::make_tuple(self.n); })
             .def("__repr__", &MultiBinary::repr)
             .def(pybind11::self == pybind11::self)
             .def(pybind11::pickle(
@@ -195,7 +323,7 @@ namespace slxpy::env::space
                     return MultiBinary(t[0].cast<size_t>());
                 }
             ));
-        MultiBinary_PB.attr("dtype") = pybind11::dtype::of<MultiBinary::value_type>();
+        slxpy_bind_sampling(MultiBinary_PB);
     }
 
     template <typename T>
@@ -220,17 +348,8 @@ namespace slxpy::env::space
         using npa = pybind11::array_t<T, pybind11::array::c_style | pybind11::array::forcecast>;
 
         pybind11::class_<Box> Box_PB(s, slxpy_get_box_typename<T>(), pybind11::module_local());
-        auto contains = [](Box& self, npa array) {
-            if (static_cast<size_t>(array.ndim()) != self.shape.size()) {
-                return false;
-            }
-            if (!std::equal(self.shape.begin(), self.shape.end(), array.shape())) {
-                return false;
-            }
-            T* ptr = static_cast<T*>(array.request(false).ptr);
-            return self.contains(ptr);
-        };
         Box_PB
+            .def(pybind11::init<typename Box::container_type, typename Box::container_type, typename Box::shape_type>(), "low"_a, "high"_a, "shape"_a)
             .def_property_readonly("shape", [] (Box& self) {
                 return pybind11::tuple(pybind11::cast(self.shape));
             })
@@ -246,8 +365,6 @@ namespace slxpy::env::space
                 reinterpret_cast<pybind11::detail::PyArray_Proxy*>(arr.ptr())->flags &= ~pybind11::detail::npy_api::NPY_ARRAY_WRITEABLE_;
                 return arr;
             })
-            .def("contains", contains)
-            .def("__contains__", contains)
             .def("__repr__", &Box::repr)
             .def(pybind11::self == pybind11::self)
             .def(pybind11::pickle(
@@ -257,7 +374,7 @@ namespace slxpy::env::space
                     return Box(t[0].cast<typename Box::container_type>(), t[1].cast<typename Box::container_type>(), t[2].cast<typename Box::shape_type>());
                 }
             ));
-        Box_PB.attr("dtype") = pybind11::dtype::of<typename Box::value_type>();
+        slxpy_bind_sampling(Box_PB);
     }
 }
 
@@ -320,6 +437,12 @@ namespace slxpy::env::gym_spaces {
         return BoxClass(low_np, high_np, shape, dtype);
     }
 
+    // Space of k stacked observations of space, as gymnasium's FrameStackObservation
+    pybind11::object stack_space(pybind11::object space, size_t k) {
+        auto batch_space = pybind11::module::import("gymnasium.vector.utils").attr("batch_space");
+        return batch_space(space, k);
+    }
+
     pybind11::object make_discrete(pybind11::ssize_t n) {
         auto gym_spaces = pybind11::module::import("gymnasium.spaces");
         auto DiscreteClass = gym_spaces.attr("Discrete");
@@ -368,7 +491,22 @@ namespace slxpy::env::spec {
     };
     enum class ActionRepeatMode: uint8_t {
         // Reward_Done
-        SUM_BREAK = 0
+        // Reward reduction over sub-steps: SUM, MEAN, LAST or MAX
+        // BREAK stops at the first done, otherwise all sub-steps run and done is latched
+        SUM_BREAK = 0,
+        SUM,
+        MEAN_BREAK,
+        MEAN,
+        LAST_BREAK,
+        LAST,
+        MAX_BREAK,
+        MAX
+    };
+    enum class AutoresetMode: uint8_t {
+        // SAME_STEP resets a finished env within the step, its last observation goes to info["final_obs"]
+        // NEXT_STEP returns the last observation and resets on the following step, ignoring that action
+        SAME_STEP = 0,
+        NEXT_STEP
     };
     static const char* IndexingModeNames[] = {
         "PRESERVE_EMPTY",
@@ -376,7 +514,18 @@ namespace slxpy::env::spec {
         "COMPRESS"
     };
     static const char* ActionRepeatModeNames[] = {
-        "SUM_BREAK"
+        "SUM_BREAK",
+        "SUM",
+        "MEAN_BREAK",
+        "MEAN",
+        "LAST_BREAK",
+        "LAST",
+        "MAX_BREAK",
+        "MAX"
+    };
+    static const char* AutoresetModeNames[] = {
+        "SAME_STEP",
+        "NEXT_STEP"
     };
     class EnvSpec
     {
@@ -391,6 +540,7 @@ namespace slxpy::env::spec {
         bool need_render = false; // here?
         size_t action_repeat = 0;
         ActionRepeatMode action_repeat_mode = ActionRepeatMode::SUM_BREAK;
+        AutoresetMode autoreset_mode = AutoresetMode::SAME_STEP;
         pybind11::dict kwargs;
     public:
         std::string repr() {
@@ -405,8 +555,9 @@ namespace slxpy::env::spec {
     need_render={},
     action_repeat={},
     action_repeat_mode=<ActionRepeatMode.{}>,
+    autoreset_mode=<AutoresetMode.{}>,
     kwargs={}
-))--", id, reward_threshold, max_episode_steps, IndexingModeNames[static_cast<uint8_t>(indexing_mode)], nondeterministic, auto_reset, strict_reset, need_render, action_repeat, ActionRepeatModeNames[static_cast<uint8_t>(action_repeat_mode)], std::string(pybind11::repr(kwargs)));
+))--", id, reward_threshold, max_episode_steps, IndexingModeNames[static_cast<uint8_t>(indexing_mode)], nondeterministic, auto_reset, strict_reset, need_render, action_repeat, ActionRepeatModeNames[static_cast<uint8_t>(action_repeat_mode)], AutoresetModeNames[static_cast<uint8_t>(autoreset_mode)], std::string(pybind11::repr(kwargs)));
         }
     };
 
@@ -419,7 +570,19 @@ namespace slxpy::env::spec {
 
         pybind11::enum_<ActionRepeatMode> ActionRepeatMode_PB(s, "ActionRepeatMode", pybind11::module_local());
         ActionRepeatMode_PB
-            .value("SUM_BREAK", ActionRepeatMode::SUM_BREAK);
+            .value("SUM_BREAK", ActionRepeatMode::SUM_BREAK)
+            .value("SUM", ActionRepeatMode::SUM)
+            .value("MEAN_BREAK", ActionRepeatMode::MEAN_BREAK)
+            .value("MEAN", ActionRepeatMode::MEAN)
+            .value("LAST_BREAK", ActionRepeatMode::LAST_BREAK)
+            .value("LAST", ActionRepeatMode::LAST)
+            .value("MAX_BREAK", ActionRepeatMode::MAX_BREAK)
+            .value("MAX", ActionRepeatMode::MAX);
+
+        pybind11::enum_<AutoresetMode> AutoresetMode_PB(s, "AutoresetMode", pybind11::module_local());
+        AutoresetMode_PB
+            .value("SAME_STEP", AutoresetMode::SAME_STEP)
+            .value("NEXT_STEP", AutoresetMode::NEXT_STEP);
 
         pybind11::class_<EnvSpec> EnvSpec_PB(s, "EnvSpec", pybind11::module_local());
         EnvSpec_PB
@@ -434,6 +597,7 @@ namespace slxpy::env::spec {
                     bool need_render,
                     size_t action_repeat,
                     ActionRepeatMode action_repeat_mode,
+                    AutoresetMode autoreset_mode,
                     pybind11::kwargs kwargs
                 ) -> EnvSpec {
                     if (id.size() == 0) {
@@ -451,13 +615,15 @@ namespace slxpy::env::spec {
                         need_render,
                         action_repeat,
                         action_repeat_mode,
+                        autoreset_mode,
                         kwargs
                     };
                 }),
                 "id"_a, "reward_threshold"_a=std::nullopt, "max_episode_steps"_a=std::nullopt,
                 "indexing_mode"_a=IndexingMode::PRESERVE_EMPTY,
                 "nondeterministic"_a=false, "auto_reset"_a=false, "strict_reset"_a=true, "need_render"_a=false,
-                "action_repeat"_a=0, "action_repeat_mode"_a=ActionRepeatMode::SUM_BREAK
+                "action_repeat"_a=0, "action_repeat_mode"_a=ActionRepeatMode::SUM_BREAK,
+                "autoreset_mode"_a=AutoresetMode::SAME_STEP
             )
             .def_readonly("id", &EnvSpec::id)
             .def_readonly("reward_threshold", &EnvSpec::reward_threshold)
@@ -469,8 +635,39 @@ namespace slxpy::env::spec {
             .def_readonly("need_render", &EnvSpec::need_render)
             .def_readonly("action_repeat", &EnvSpec::action_repeat)
             .def_readonly("action_repeat_mode", &EnvSpec::action_repeat_mode)
+            .def_readonly("autoreset_mode", &EnvSpec::autoreset_mode)
             .def_readonly("kwargs", &EnvSpec::kwargs)
-            .def("__repr__", &EnvSpec::repr);
+            .def("__repr__", &EnvSpec::repr)
+            .def(pybind11::pickle(
+                [](const EnvSpec& self) {
+                    return pybind11::make_tuple(
+                        self.id, self.reward_threshold, self.max_episode_steps,
+                        static_cast<uint8_t>(self.indexing_mode),
+                        self.nondeterministic, self.auto_reset, self.strict_reset, self.need_render,
+                        self.action_repeat, static_cast<uint8_t>(self.action_repeat_mode),
+                        static_cast<uint8_t>(self.autoreset_mode), self.kwargs
+                    );
+                },
+                [](pybind11::tuple t) -> EnvSpec {
+                    if (t.size() != 12) {
+                        throw std::runtime_error("Invalid pickled EnvSpec.");
+                    }
+                    return {
+                        t[0].cast<std::string>(),
+                        t[1].cast<std::optional<double>>(),
+                        t[2].cast<std::optional<size_t>>(),
+                        static_cast<IndexingMode>(t[3].cast<uint8_t>()),
+                        t[4].cast<bool>(),
+                        t[5].cast<bool>(),
+                        t[6].cast<bool>(),
+                        t[7].cast<bool>(),
+                        t[8].cast<size_t>(),
+                        static_cast<ActionRepeatMode>(t[9].cast<uint8_t>()),
+                        static_cast<AutoresetMode>(t[10].cast<uint8_t>()),
+                        t[11].cast<pybind11::dict>()
+                    };
+                }
+            ));
     }
 }
 
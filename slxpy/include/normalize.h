@@ -0,0 +1,99 @@
+#pragma once
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
+#include <vector>
+
+namespace slxpy::normalize
+{
+    // Running mean and (population) variance of a stream of fixed-size vectors.
+    // Batches are reduced in parallel parts with Welford's algorithm,
+    // then merged into the running moments with the pairwise update of Chan et al.
+    class RunningMeanStd
+    {
+        std::vector<size_t> shape_;
+        std::vector<double> partial;  // Per part mean, M2 and count, reused between updates
+    public:
+        std::vector<double> mean;
+        std::vector<double> var;
+        double count;
+
+        RunningMeanStd(std::vector<size_t> shape = {}, double epsilon = 1e-4): shape_(std::move(shape)), count(epsilon) {
+            size_t size = 1;
+            for (size_t s : shape_) {
+                size *= s;
+            }
+            mean.assign(size, 0.0);
+            var.assign(size, 1.0);
+        }
+
+        const std::vector<size_t>& shape() const { return shape_; }
+        size_t size() const { return mean.size(); }
+
+        // Merge moments of a batch, batch_m2 is the sum of squared deviations from batch_mean
+        void merge(const double* batch_mean, const double* batch_m2, double batch_count) {
+            if (batch_count <= 0) {
+                return;
+            }
+            const double total = count + batch_count;
+            for (size_t d = 0; d < size(); d++) {
+                const double delta = batch_mean[d] - mean[d];
+                const double m2 = var[d] * count + batch_m2[d] + delta * delta * count * batch_count / total;
+                mean[d] += delta * batch_count / total;
+                var[d] = m2 / total;
+            }
+            count = total;
+        }
+
+        // Update with row(k) for k in [0, length), each row a pointer to size() values.
+        // Rows are split into one part per pool thread, reduced concurrently and merged in order.
+        template <typename Pool, typename Row>
+        void update(Pool& pool, size_t length, Row&& row) {
+            const size_t dim = size();
+            const size_t parts = std::min(length, pool.num_threads());
+            if (parts == 0) {
+                return;
+            }
+            const size_t stride = 2 * dim + 1;
+            partial.assign(parts * stride, 0.0);
+            pool.parallel_for(parts, [this, dim, stride, parts, length, &row](size_t begin, size_t end) {
+                for (size_t p = begin; p < end; p++) {
+                    double* m = partial.data() + p * stride;
+                    double* m2 = m + dim;
+                    double n = 0;
+                    for (size_t k = p * length / parts, hi = (p + 1) * length / parts; k < hi; k++) {
+                        const auto* x = row(k);
+                        n += 1;
+                        for (size_t d = 0; d < dim; d++) {
+                            const double delta = static_cast<double>(x[d]) - m[d];
+                            m[d] += delta / n;
+                            m2[d] += delta * (static_cast<double>(x[d]) - m[d]);
+                        }
+                    }
+                    m[2 * dim] = n;
+                }
+            });
+            for (size_t p = 0; p < parts; p++) {
+                const double* m = partial.data() + p * stride;
+                merge(m, m + dim, m[2 * dim]);
+            }
+        }
+
+        // 1 / sqrt(var + epsilon), per element
+        void inverse_std(double epsilon, std::vector<double>& out) const {
+            out.resize(size());
+            for (size_t d = 0; d < size(); d++) {
+                out[d] = 1.0 / std::sqrt(var[d] + epsilon);
+            }
+        }
+    };
+
+    // Normalize size values in place with precomputed inverse std, clipping to [-clip, clip]
+    template <typename T>
+    inline void apply(T* x, size_t size, const double* mean, const double* inv_std, double clip) {
+        for (size_t d = 0; d < size; d++) {
+            const double v = (static_cast<double>(x[d]) - mean[d]) * inv_std[d];
+            x[d] = static_cast<T>(std::clamp(v, -clip, clip));
+        }
+    }
+}
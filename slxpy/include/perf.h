@@ -0,0 +1,189 @@
+#pragma once
+#include <algorithm>
+#include <array>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#if defined(_MSC_VER)
+#include <intrin.h>
+#elif defined(__x86_64__) || defined(__i386__)
+#include <x86intrin.h>
+#endif
+
+namespace slxpy::perf
+{
+    // Per-phase latency counters of generated envs, only compiled in with perf_counters in env.toml.
+    // Each env owns its counters and only the thread stepping it writes them, so recording takes no lock.
+    // Per-env phases come first, BOXING (wrapper overhead around the C++ work) is last
+    enum Phase : size_t { INPUT = 0, STEP, RESET, OUTPUT, BOXING, PHASE_COUNT };
+    constexpr const char* phase_names[PHASE_COUNT] = { "input", "step", "reset", "output", "boxing" };
+
+    // Bucket k counts durations in [2^k, 2^(k+1)) ns, bucket 0 also counts 0 ns and the last bucket everything above
+    constexpr size_t bucket_count = 40;
+
+    // Timestamps are TSC ticks on x86 (about half the cost of steady_clock), steady_clock nanoseconds elsewhere.
+    // Durations are converted to nanoseconds when recorded.
+#if defined(__x86_64__) || defined(_M_X64) || defined(__i386__) || defined(_M_IX86)
+    inline uint64_t now() {
+        return __rdtsc();
+    }
+    // Nanoseconds per tick, calibrated once against steady_clock (assumes an invariant TSC)
+    inline double tick_ns() {
+        static const double ratio = [] {
+            using clock = std::chrono::steady_clock;
+            const auto t0 = clock::now();
+            const uint64_t c0 = __rdtsc();
+            while (clock::now() - t0 < std::chrono::milliseconds(2)) {}
+            const double elapsed = std::chrono::duration<double, std::nano>(clock::now() - t0).count();
+            return elapsed / static_cast<double>(__rdtsc() - c0);
+        }();
+        return ratio;
+    }
+#else
+    inline uint64_t now() {
+        return static_cast<uint64_t>(std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now().time_since_epoch()).count());
+    }
+    inline double tick_ns() {
+        return 1.0;
+    }
+#endif
+
+    inline size_t bucket_of(uint64_t ns) {
+        size_t k = 0;
+        for (size_t shift = 32; shift > 0; shift >>= 1) {
+            if (ns >> shift) {
+                ns >>= shift;
+                k += shift;
+            }
+        }
+        return k < bucket_count ? k : bucket_count - 1;
+    }
+
+    struct Histogram
+    {
+        uint64_t count{ 0 };
+        uint64_t total{ 0 };
+        uint64_t min{ std::numeric_limits<uint64_t>::max() };
+        uint64_t max{ 0 };
+        std::array<uint64_t, bucket_count> buckets{};
+
+        void record(uint64_t ns) {
+            count++;
+            total += ns;
+            min = ns < min ? ns : min;
+            max = ns > max ? ns : max;
+            buckets[bucket_of(ns)]++;
+        }
+        void merge(const Histogram& other) {
+            count += other.count;
+            total += other.total;
+            min = other.min < min ? other.min : min;
+            max = other.max > max ? other.max : max;
+            for (size_t k = 0; k < bucket_count; k++) {
+                buckets[k] += other.buckets[k];
+            }
+        }
+    };
+
+    struct Counters
+    {
+        std::array<Histogram, PHASE_COUNT> phases{};
+
+        // Record a duration in ticks of now()
+        void record(Phase phase, uint64_t ticks) {
+            phases[phase].record(static_cast<uint64_t>(static_cast<double>(ticks) * tick_ns()));
+        }
+        // Record the time since `since` and return the current time, to chain consecutive phases
+        uint64_t lap(Phase phase, uint64_t since) {
+            const uint64_t t = now();
+            record(phase, t - since);
+            return t;
+        }
+        void merge(const Counters& other) {
+            for (size_t p = 0; p < PHASE_COUNT; p++) {
+                phases[p].merge(other.phases[p]);
+            }
+        }
+        void clear() {
+            phases = {};
+        }
+    };
+
+    // Records the lifetime of a scope into one phase, leaving out intervals passed to exclude
+    class Scope
+    {
+        Counters& counters;
+        Phase phase;
+        uint64_t start;
+        uint64_t excluded{ 0 };
+    public:
+        Scope(Counters& counters, Phase phase): counters(counters), phase(phase), start(now()) {}
+        Scope(const Scope&) = delete;
+        Scope& operator=(const Scope&) = delete;
+        // Leave out the time since `since`, e.g. the C++ work inside a wrapper
+        void exclude(uint64_t since) {
+            excluded += now() - since;
+        }
+        ~Scope() {
+            counters.record(phase, now() - start - excluded);
+        }
+    };
+
+    // Summary of one histogram: count, total_ns, mean_ns, min_ns, max_ns and the bucket counts
+    inline pybind11::dict to_dict(const Histogram& h) {
+        pybind11::array_t<uint64_t> buckets{ static_cast<pybind11::ssize_t>(bucket_count) };
+        std::copy(h.buckets.begin(), h.buckets.end(), buckets.mutable_data());
+        pybind11::dict d;
+        d["count"] = h.count;
+        d["total_ns"] = h.total;
+        d["mean_ns"] = h.count ? static_cast<double>(h.total) / static_cast<double>(h.count) : 0.0;
+        d["min_ns"] = h.count ? h.min : 0;
+        d["max_ns"] = h.max;
+        d["histogram"] = buckets;
+        return d;
+    }
+
+    inline pybind11::dict to_dict(const Counters& c) {
+        pybind11::dict d;
+        for (size_t p = 0; p < PHASE_COUNT; p++) {
+            d[phase_names[p]] = to_dict(c.phases[p]);
+        }
+        return d;
+    }
+
+    // Counters of length envs merged with those of the batch (BOXING, recorded per batch call), and with per_env,
+    // a "per_env" dict of (B,) count and total_ns and a (B, bucket_count) histogram for each per-env phase.
+    template <typename Get>
+    pybind11::dict to_dict(size_t length, Get&& get, const Counters& batch, bool per_env) {
+        Counters total = batch;
+        for (size_t i = 0; i < length; i++) {
+            total.merge(get(i));
+        }
+        pybind11::dict d = to_dict(total);
+        if (!per_env) {
+            return d;
+        }
+        const auto n = static_cast<pybind11::ssize_t>(length);
+        for (size_t p = 0; p < BOXING; p++) {
+            pybind11::array_t<uint64_t> count{ n }, sum{ n }, hist{ { n, static_cast<pybind11::ssize_t>(bucket_count) } };
+            uint64_t* count_buf = count.mutable_data();
+            uint64_t* sum_buf = sum.mutable_data();
+            uint64_t* hist_buf = hist.mutable_data();
+            for (size_t i = 0; i < length; i++) {
+                const Histogram& h = get(i).phases[p];
+                count_buf[i] = h.count;
+                sum_buf[i] = h.total;
+                std::copy(h.buckets.begin(), h.buckets.end(), hist_buf + i * bucket_count);
+            }
+            pybind11::dict env_stats;
+            env_stats["count"] = count;
+            env_stats["total_ns"] = sum;
+            env_stats["histogram"] = hist;
+            d[phase_names[p]].cast<pybind11::dict>()["per_env"] = env_stats;
+        }
+        return d;
+    }
+}
@@ -0,0 +1,48 @@
+#pragma once
+#include <cstdint>
+#include <stdexcept>
+#include <fmt/core.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+namespace slxpy::pickle
+{
+    // Pickled state is a tuple of (layout_hash, buffer, ...)
+    // On protocol 5 the buffer is a PickleBuffer, so it can be transferred out-of-band without copy.
+    // __getstate__ (used by protocols without __reduce_ex__ support) copies the buffer to bytes.
+
+    // Byte view of memory owned by obj, keeping obj alive
+    inline pybind11::array_t<uint8_t> view(const void* ptr, size_t size, pybind11::handle owner) {
+        return pybind11::array_t<uint8_t>{ { static_cast<pybind11::ssize_t>(size) }, {}, static_cast<const uint8_t*>(ptr), owner };
+    }
+
+    inline pybind11::object export_buffer(pybind11::array_t<uint8_t> data, int protocol) {
+        if (protocol >= 5) {
+            return pybind11::module_::import("pickle").attr("PickleBuffer")(data);
+        }
+        return pybind11::bytes(reinterpret_cast<const char*>(data.data()), static_cast<size_t>(data.size()));
+    }
+
+    // __reduce_ex__ result creating an uninitialized instance, then constructing it with __setstate__(state)
+    inline pybind11::tuple reduce(pybind11::handle obj, pybind11::tuple state) {
+        auto newobj = pybind11::module_::import("copyreg").attr("__newobj__");
+        return pybind11::make_tuple(newobj, pybind11::make_tuple(pybind11::type::handle_of(obj)), state);
+    }
+
+    // Validate hash and size of a pickled state, returning its buffer
+    inline pybind11::buffer_info import_buffer(const pybind11::tuple& state, uint64_t layout_hash, size_t expected_size) {
+        if (state.size() < 2) {
+            throw std::runtime_error("Invalid pickled state.");
+        }
+        const auto hash = state[0].cast<uint64_t>();
+        if (hash != layout_hash) {
+            throw std::runtime_error(fmt::format("Pickled state has layout hash {:016x}, but this extension has {:016x}. It was created by an incompatible build.", hash, layout_hash));
+        }
+        pybind11::buffer_info info = state[1].cast<pybind11::buffer>().request();
+        const size_t size = static_cast<size_t>(info.size * info.itemsize);
+        if (size != expected_size) {
+            throw std::runtime_error(fmt::format("Pickled state size mismatch, expecting {} bytes, got {}.", expected_size, size));
+        }
+        return info;
+    }
+}
@@ -0,0 +1,226 @@
+#pragma once
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <random>
+#include <type_traits>
+
+namespace slxpy::random
+{
+    // Compact engines as alternatives to std::mt19937 (5 KB of state) for large batches.
+    // Both satisfy UniformRandomBitGenerator, so standard distributions work unchanged,
+    // and are trivially copyable, so they can be part of a snapshot.
+    // Streams are keyed by (seed, stream), vectorized envs use the env index as stream,
+    // and each episode (see next_episode) draws from its own substream.
+
+    // Counter-based Philox4x32-10 (Salmon et al., "Parallel random numbers: as easy as 1, 2, 3").
+    // The 64-bit seed is the key, the counter holds (block index, stream, episode).
+    class Philox4x32
+    {
+        uint32_t key[2]{ 0, 0 };
+        uint32_t counter[4]{ 0, 0, 0, 0 };  // Block index (64 bits), stream, episode
+        uint32_t block[4]{ 0, 0, 0, 0 };
+        uint32_t next{ 4 };  // Position in block, 4 -> exhausted
+
+        static void mulhilo(uint32_t a, uint32_t b, uint32_t& lo, uint32_t& hi) {
+            const uint64_t product = static_cast<uint64_t>(a) * b;
+            lo = static_cast<uint32_t>(product);
+            hi = static_cast<uint32_t>(product >> 32);
+        }
+        void generate() {
+            uint32_t c[4] = { counter[0], counter[1], counter[2], counter[3] };
+            uint32_t k0 = key[0], k1 = key[1];
+            for (int round = 0; round < 10; round++) {
+                uint32_t lo0, hi0, lo1, hi1;
+                mulhilo(0xD2511F53u, c[0], lo0, hi0);
+                mulhilo(0xCD9E8D57u, c[2], lo1, hi1);
+                c[0] = hi1 ^ c[1] ^ k0;
+                c[1] = lo1;
+                c[2] = hi0 ^ c[3] ^ k1;
+                c[3] = lo0;
+                k0 += 0x9E3779B9u;
+                k1 += 0xBB67AE85u;
+            }
+            for (int i = 0; i < 4; i++) {
+                block[i] = c[i];
+            }
+            if (++counter[0] == 0) {
+                ++counter[1];
+            }
+            next = 0;
+        }
+    public:
+        using result_type = uint32_t;
+        static constexpr result_type default_seed = 5489u;
+        static constexpr result_type min() { return 0; }
+        static constexpr result_type max() { return std::numeric_limits<result_type>::max(); }
+
+        Philox4x32() { seed(); }
+        explicit Philox4x32(uint64_t s, uint64_t stream = 0) { seed(s, stream); }
+
+        void seed(uint32_t s = default_seed) { seed(static_cast<uint64_t>(s), 0); }
+        void seed(uint64_t s, uint64_t stream) {
+            key[0] = static_cast<uint32_t>(s);
+            key[1] = static_cast<uint32_t>(s >> 32);
+            counter[0] = counter[1] = 0;
+            counter[2] = static_cast<uint32_t>(stream);
+            counter[3] = 0;
+            next = 4;
+        }
+        // Move to the start of the next episode substream, independent of draws taken so far
+        void next_episode() {
+            counter[0] = counter[1] = 0;
+            ++counter[3];
+            next = 4;
+        }
+        result_type operator()() {
+            if (next == 4) {
+                generate();
+            }
+            return block[next++];
+        }
+        void discard(unsigned long long n) {
+            for (; n > 0; --n) {
+                (*this)();
+            }
+        }
+    };
+
+    // PCG32 (XSH RR), O'Neill, "PCG: A family of simple fast space-efficient statistically good algorithms".
+    // The stream selects the increment, each episode reseeds the state from (seed, episode).
+    class PCG32
+    {
+        uint64_t state{ 0 };
+        uint64_t inc{ 1 };
+        uint64_t key{ 0 };  // Seed, kept to derive episode states
+        uint64_t episode{ 0 };
+
+        void step() { state = state * 6364136223846793005ULL + inc; }
+        void reseed(uint64_t initstate) {
+            state = 0;
+            step();
+            state += initstate;
+            step();
+        }
+        static uint64_t mix(uint64_t x) {
+            // splitmix64 finalizer
+            x += 0x9E3779B97F4A7C15ULL;
+            x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9ULL;
+            x = (x ^ (x >> 27)) * 0x94D049BB133111EBULL;
+            return x ^ (x >> 31);
+        }
+    public:
+        using result_type = uint32_t;
+        static constexpr result_type default_seed = 5489u;
+        static constexpr result_type min() { return 0; }
+        static constexpr result_type max() { return std::numeric_limits<result_type>::max(); }
+
+        PCG32() { seed(); }
+        explicit PCG32(uint64_t s, uint64_t stream = 0) { seed(s, stream); }
+
+        void seed(uint32_t s = default_seed) { seed(static_cast<uint64_t>(s), 0); }
+        void seed(uint64_t s, uint64_t stream) {
+            key = s;
+            episode = 0;
+            inc = (stream << 1u) | 1u;
+            reseed(s);
+        }
+        void next_episode() {
+            ++episode;
+            reseed(key ^ mix(episode));
+        }
+        result_type operator()() {
+            const uint64_t old = state;
+            step();
+            const uint32_t xorshifted = static_cast<uint32_t>(((old >> 18u) ^ old) >> 27u);
+            const uint32_t rot = static_cast<uint32_t>(old >> 59u);
+            return (xorshifted >> rot) | (xorshifted << ((~rot + 1u) & 31u));
+        }
+        void discard(unsigned long long n) {
+            for (; n > 0; --n) {
+                step();
+            }
+        }
+    };
+
+    template <typename Engine>
+    struct is_keyed : std::false_type {};
+    template <>
+    struct is_keyed<Philox4x32> : std::true_type {};
+    template <>
+    struct is_keyed<PCG32> : std::true_type {};
+    template <typename Engine>
+    constexpr bool is_keyed_v = is_keyed<Engine>::value;
+
+    // Seed stream of a keyed engine, other engines take the seed only
+    template <typename Engine>
+    inline void seed_stream(Engine& engine, uint32_t seed, uint64_t stream) {
+        if constexpr (is_keyed_v<Engine>) {
+            engine.seed(static_cast<uint64_t>(seed), stream);
+        } else {
+            engine.seed(seed);
+        }
+    }
+
+    // Called at every reset, engines without substreams keep running
+    template <typename Engine>
+    inline void next_episode(Engine& engine) {
+        if constexpr (is_keyed_v<Engine>) {
+            engine.next_episode();
+        }
+    }
+
+    // Block draws for parameter initialization, filling n values in one pass
+
+    // Uniform on [0, 1), the same values std::uniform_real_distribution<double> draws
+    template <typename Engine>
+    inline double canonical(Engine& engine) {
+        return std::generate_canonical<double, std::numeric_limits<double>::digits>(engine);
+    }
+    template <typename Engine>
+    inline void fill_canonical(Engine& engine, double* out, size_t n) {
+        for (size_t i = 0; i < n; i++) {
+            out[i] = canonical(engine);
+        }
+    }
+
+    // Standard normal pair by the Marsaglia polar method
+    template <typename Engine>
+    inline void normal_pair(Engine& engine, double& z0, double& z1) {
+        double x, y, r2;
+        do {
+            x = 2.0 * canonical(engine) - 1.0;
+            y = 2.0 * canonical(engine) - 1.0;
+            r2 = x * x + y * y;
+        } while (r2 > 1.0 || r2 == 0.0);
+        const double scale = std::sqrt(-2.0 * std::log(r2) / r2);
+        z0 = x * scale;
+        z1 = y * scale;
+    }
+    template <typename Engine>
+    inline double normal(Engine& engine) {
+        double z0, z1;
+        normal_pair(engine, z0, z1);
+        return z0;
+    }
+    template <typename Engine>
+    inline void fill_normal(Engine& engine, double* out, size_t n) {
+        for (size_t i = 0; i + 1 < n; i += 2) {
+            normal_pair(engine, out[i], out[i + 1]);
+        }
+        if (n % 2) {
+            out[n - 1] = normal(engine);
+        }
+    }
+
+    // Normal restricted to [low, high] by rejection, clamped after max_tries draws (far tails)
+    template <typename Engine>
+    inline double truncated_normal(Engine& engine, double z, double mean, double std, double low, double high, int max_tries = 64) {
+        double x = mean + std * z;
+        for (int t = 0; (x < low || x > high) && t < max_tries; t++) {
+            x = mean + std * normal(engine);
+        }
+        return x < low ? low : (x > high ? high : x);
+    }
+}
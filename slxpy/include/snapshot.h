@@ -0,0 +1,73 @@
+#pragma once
+#include <cstdint>
+#include <cstring>
+#include <initializer_list>
+#include <utility>
+#include <vector>
+#include <stdexcept>
+#include <fmt/core.h>
+
+namespace slxpy::snapshot
+{
+    // Prefix of every state buffer, used to validate and relocate on restore
+    struct Header {
+        char magic[8];
+        uint64_t size;  // Byte size of the state following the header
+        uint64_t base;  // Address of the model object the state was taken from
+    };
+    constexpr char magic[8] = { 'S', 'L', 'X', 'P', 'Y', 'S', 'T', 'A' };
+
+    inline void write_header(unsigned char* buf, uint64_t size, const void* base) {
+        Header h;
+        std::memcpy(h.magic, magic, sizeof(magic));
+        h.size = size;
+        h.base = static_cast<uint64_t>(reinterpret_cast<uintptr_t>(base));
+        std::memcpy(buf, &h, sizeof(Header));
+    }
+
+    inline Header read_header(const unsigned char* buf, size_t length, uint64_t expected_size) {
+        if (length < sizeof(Header)) {
+            throw std::runtime_error("State buffer is too short.");
+        }
+        Header h;
+        std::memcpy(&h, buf, sizeof(Header));
+        if (std::memcmp(h.magic, magic, sizeof(magic)) != 0) {
+            throw std::runtime_error("Not a slxpy state buffer.");
+        }
+        if (h.size != expected_size || length != sizeof(Header) + expected_size) {
+            throw std::runtime_error(fmt::format("State buffer size mismatch, expecting {} bytes of state, got {}.", expected_size, h.size));
+        }
+        return h;
+    }
+
+    // Byte offsets of the pointer-sized words in fields, given as (address, byte size) of members of the object at base
+    inline std::vector<size_t> word_offsets(const void* base, std::initializer_list<std::pair<const void*, size_t>> fields) {
+        std::vector<size_t> offsets;
+        for (const auto& [address, bytes] : fields) {
+            const size_t begin = static_cast<size_t>(reinterpret_cast<uintptr_t>(address) - reinterpret_cast<uintptr_t>(base));
+            for (size_t offset = begin; offset + sizeof(uintptr_t) <= begin + bytes; offset += sizeof(uintptr_t)) {
+                offsets.push_back(offset);
+            }
+        }
+        return offsets;
+    }
+
+    // Copy a model object taken at address base into dst, rebasing the pointer words at offsets
+    // (see word_offsets) that point inside the source object. No other word is touched.
+    inline void copy_relocated(void* dst, const void* src, size_t size, uintptr_t base, const std::vector<size_t>& offsets) {
+        std::memmove(dst, src, size);
+        const uintptr_t target = reinterpret_cast<uintptr_t>(dst);
+        if (target == base) {
+            return;
+        }
+        unsigned char* bytes = static_cast<unsigned char*>(dst);
+        for (size_t offset : offsets) {
+            uintptr_t word;
+            std::memcpy(&word, bytes + offset, sizeof(uintptr_t));
+            if (word >= base && word - base < size) {
+                word = word - base + target;
+                std::memcpy(bytes + offset, &word, sizeof(uintptr_t));
+            }
+        }
+    }
+}
@@ -0,0 +1,213 @@
+#pragma once
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <deque>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace slxpy::parallel
+{
+    // Persistent worker pool for vectorized environments.
+    // Workers are started once and parked on a condition variable between calls,
+    // the calling thread always takes part in the work, so a pool of N threads owns N - 1 workers.
+    // Work is handed out dynamically in chunks of grain_size, thus slow envs do not stall the others.
+    // Besides blocking parallel_for, tasks can be posted to run in background (see post).
+    class ThreadPool
+    {
+    public:
+        using task_T = std::function<void(size_t)>;
+    private:
+        struct Job {
+            void (*invoke)(void* ctx, size_t begin, size_t end);
+            void* ctx;
+            size_t length;
+            size_t grain_size;
+            std::atomic<size_t> next{ 0 };
+            size_t active{ 0 };  // Guarded by mutex
+            std::exception_ptr error;  // Guarded by mutex
+        };
+
+        size_t num_threads_;
+        size_t grain_size_;
+        std::vector<std::thread> workers;
+        std::mutex mutex;
+        std::condition_variable wake;
+        std::condition_variable finish;
+        Job* job{ nullptr };
+        uint64_t generation{ 0 };
+        bool stop{ false };
+        std::deque<std::pair<const task_T*, size_t>> tasks;  // Guarded by mutex
+        size_t running_tasks{ 0 };  // Guarded by mutex
+        std::condition_variable idle;
+
+        void run(Job& j) {
+            while (true) {
+                size_t begin = j.next.fetch_add(j.grain_size, std::memory_order_relaxed);
+                if (begin >= j.length) {
+                    break;
+                }
+                size_t end = std::min(begin + j.grain_size, j.length);
+                try {
+                    j.invoke(j.ctx, begin, end);
+                } catch (...) {
+                    // Keep the first error and cancel remaining chunks
+                    std::lock_guard<std::mutex> lock(mutex);
+                    if (!j.error) {
+                        j.error = std::current_exception();
+                    }
+                    j.next.store(j.length, std::memory_order_relaxed);
+                }
+            }
+        }
+        void worker_loop() {
+            uint64_t seen = 0;
+            while (true) {
+                Job* j = nullptr;
+                std::pair<const task_T*, size_t> task;
+                {
+                    std::unique_lock<std::mutex> lock(mutex);
+                    wake.wait(lock, [this, seen] { return stop || (job && generation != seen) || !tasks.empty(); });
+                    if (stop) {
+                        return;
+                    }
+                    if (job && generation != seen) {
+                        // Blocking jobs take precedence over background tasks
+                        seen = generation;
+                        j = job;
+                        ++j->active;
+                    } else {
+                        task = tasks.front();
+                        tasks.pop_front();
+                        ++running_tasks;
+                    }
+                }
+                if (j) {
+                    run(*j);
+                    std::lock_guard<std::mutex> lock(mutex);
+                    if (--j->active == 0) {
+                        finish.notify_all();
+                    }
+                } else {
+                    (*task.first)(task.second);
+                    std::lock_guard<std::mutex> lock(mutex);
+                    if (--running_tasks == 0 && tasks.empty()) {
+                        idle.notify_all();
+                    }
+                }
+            }
+        }
+        size_t resolve_grain_size(size_t length) const {
+            if (grain_size_ > 0) {
+                return grain_size_;
+            }
+            // Automatic grain size, several chunks per thread to balance uneven envs
+            return std::max<size_t>(1, length / (num_threads_ * 8));
+        }
+    public:
+        // num_threads == 0 uses all hardware threads, grain_size == 0 picks chunk size automatically.
+        ThreadPool(size_t num_threads = 1, size_t grain_size = 0): grain_size_(grain_size) {
+            if (num_threads == 0) {
+                num_threads = std::max<size_t>(1, std::thread::hardware_concurrency());
+            }
+            num_threads_ = num_threads;
+            workers.reserve(num_threads - 1);
+            for (size_t i = 1; i < num_threads; i++) {
+                workers.emplace_back(&ThreadPool::worker_loop, this);
+            }
+        }
+
+        // Avoid unintended copy
+        ThreadPool(const ThreadPool&) = delete;
+        ThreadPool(ThreadPool&&) = delete;
+        ThreadPool& operator=(const ThreadPool&) = delete;
+        ThreadPool& operator=(ThreadPool&&) = delete;
+
+        // Call f(begin, end) over [0, length) and block until all chunks finish.
+        // The first exception thrown by f is rethrown in the calling thread.
+        template <typename F>
+        void parallel_for(size_t length, F&& f) {
+            size_t grain_size = resolve_grain_size(length);
+            if (workers.empty() || length <= grain_size) {
+                if (length > 0) {
+                    f(size_t{ 0 }, length);
+                }
+                return;
+            }
+            using func_T = std::remove_reference_t<F>;
+            Job j;
+            j.invoke = [](void* ctx, size_t begin, size_t end) { (*static_cast<func_T*>(ctx))(begin, end); };
+            j.ctx = const_cast<void*>(static_cast<const void*>(std::addressof(f)));
+            j.length = length;
+            j.grain_size = grain_size;
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                job = &j;
+                ++generation;
+            }
+            wake.notify_all();
+            run(j);
+            std::unique_lock<std::mutex> lock(mutex);
+            if (job == &j) {
+                job = nullptr;  // Late workers will not pick up this job
+            }
+            finish.wait(lock, [&j] { return j.active == 0; });
+            if (j.error) {
+                std::rethrow_exception(j.error);
+            }
+        }
+
+        // Call f(indices[k]) for every k in [0, length)
+        template <typename F>
+        void for_each(const size_t* indices, size_t length, F&& f) {
+            parallel_for(length, [indices, &f](size_t begin, size_t end) {
+                for (size_t k = begin; k < end; k++) {
+                    f(indices[k]);
+                }
+            });
+        }
+
+        // Queue (*task)(items[k]) for every k in [0, length) and return immediately.
+        // Tasks must not throw, and the task object must outlive its execution (see wait_idle).
+        // A pool without workers runs the tasks inline before returning.
+        void post(const task_T* task, const size_t* items, size_t length) {
+            if (workers.empty()) {
+                for (size_t k = 0; k < length; k++) {
+                    (*task)(items[k]);
+                }
+                return;
+            }
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                for (size_t k = 0; k < length; k++) {
+                    tasks.emplace_back(task, items[k]);
+                }
+            }
+            wake.notify_all();
+        }
+
+        // Block until every posted task has finished
+        void wait_idle() {
+            std::unique_lock<std::mutex> lock(mutex);
+            idle.wait(lock, [this] { return tasks.empty() && running_tasks == 0; });
+        }
+
+        size_t num_threads() const { return num_threads_; }
+        size_t grain_size() const { return grain_size_; }
+
+        ~ThreadPool() {
+            wait_idle();
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                stop = true;
+            }
+            wake.notify_all();
+            for (auto& worker : workers) {
+                worker.join();
+            }
+        }
+    };
+}
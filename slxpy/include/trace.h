@@ -0,0 +1,189 @@
+#pragma once
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
+#include <fstream>
+#include <memory>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <vector>
+#include "perf.h"
+
+namespace slxpy::trace
+{
+    // Contents of a JSON string literal for s, quotes, backslashes and control characters escaped
+    inline std::string json_escape(const std::string& s) {
+        static const char* hex = "0123456789abcdef";
+        std::string escaped;
+        escaped.reserve(s.size());
+        for (const char c : s) {
+            const auto u = static_cast<unsigned char>(c);
+            if (c == '"' || c == '\\') {
+                escaped += '\\';
+                escaped += c;
+            } else if (u < 0x20) {
+                escaped += "\\u00";
+                escaped += hex[u >> 4];
+                escaped += hex[u & 0xf];
+            } else {
+                escaped += c;
+            }
+        }
+        return escaped;
+    }
+
+    // Span recorder of vectorized envs, exported as Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev).
+    // Each thread appends to its own buffer, so recording takes no lock once the thread is registered.
+    // Tracing is switched at runtime, when off a span costs one relaxed atomic load.
+    class Tracer
+    {
+        struct Event {
+            const char* name;  // String literal
+            const char* category;  // String literal
+            int64_t env;  // Env id, -1 for batch-level spans
+            uint64_t begin;
+            uint64_t end;
+        };
+        struct Buffer {
+            std::thread::id thread;
+            std::vector<Event> events;
+            size_t dropped{ 0 };
+        };
+
+        std::atomic<bool> enabled_{ false };
+        const uint64_t id;  // Unique per tracer, keys the thread-local buffer cache
+        size_t capacity;  // Events per thread, later events are dropped
+        std::mutex mutex;
+        std::vector<std::unique_ptr<Buffer>> buffers;  // Registration guarded by mutex
+        std::thread::id caller;  // Thread that enabled tracing
+        uint64_t epoch{ 0 };
+
+        static uint64_t next_id() {
+            static std::atomic<uint64_t> counter{ 1 };
+            return counter.fetch_add(1, std::memory_order_relaxed);
+        }
+        Buffer* local() {
+            struct Cache {
+                uint64_t id{ 0 };
+                Buffer* buffer{ nullptr };
+            };
+            thread_local Cache cache;
+            if (cache.id == id) {
+                return cache.buffer;
+            }
+            const auto thread = std::this_thread::get_id();
+            std::lock_guard<std::mutex> lock(mutex);
+            auto it = std::find_if(buffers.begin(), buffers.end(), [thread](const std::unique_ptr<Buffer>& b) { return b->thread == thread; });
+            if (it == buffers.end()) {
+                buffers.push_back(std::make_unique<Buffer>());
+                buffers.back()->thread = thread;
+                buffers.back()->events.reserve(std::min<size_t>(capacity, 4096));
+                it = buffers.end() - 1;
+            }
+            cache = { id, it->get() };
+            return cache.buffer;
+        }
+    public:
+        Tracer(size_t capacity = size_t{ 1 } << 20): id(next_id()), capacity(capacity) {}
+        Tracer(const Tracer&) = delete;
+        Tracer& operator=(const Tracer&) = delete;
+
+        bool enabled() const {
+            return enabled_.load(std::memory_order_relaxed);
+        }
+        // Switch from the calling thread while no batch call runs
+        void set_enabled(bool enabled) {
+            if (enabled && !this->enabled()) {
+                caller = std::this_thread::get_id();
+                if (epoch == 0) {
+                    epoch = perf::now();
+                }
+            }
+            enabled_.store(enabled, std::memory_order_relaxed);
+        }
+        void record(const char* name, const char* category, int64_t env, uint64_t begin, uint64_t end) {
+            Buffer* b = local();
+            if (b->events.size() < capacity) {
+                b->events.push_back({ name, category, env, begin, end });
+            } else {
+                b->dropped++;
+            }
+        }
+        // Clear and dump must not run concurrently with recording threads
+        void clear() {
+            std::lock_guard<std::mutex> lock(mutex);
+            for (auto& b : buffers) {
+                b->events.clear();
+                b->dropped = 0;
+            }
+        }
+        size_t dropped() {
+            std::lock_guard<std::mutex> lock(mutex);
+            size_t n = 0;
+            for (auto& b : buffers) {
+                n += b->dropped;
+            }
+            return n;
+        }
+        // Write complete ("X") events, one track per thread, timestamps in microseconds since tracing was first enabled
+        void dump(const std::string& path, const std::string& process_name) {
+            std::ofstream out(path);
+            if (!out) {
+                throw std::runtime_error("Cannot open trace file " + path + ".");
+            }
+            std::lock_guard<std::mutex> lock(mutex);
+            const double scale = perf::tick_ns() / 1000.0;
+            out.precision(3);
+            out << std::fixed << "{\"displayTimeUnit\":\"ns\",\"traceEvents\":[\n";
+            out << "{\"name\":\"process_name\",\"ph\":\"M\",\"pid\":1,\"tid\":0,\"args\":{\"name\":\"" << json_escape(process_name) << "\"}}";
+            size_t dropped = 0;
+            size_t worker = 0;
+            for (size_t t = 0; t < buffers.size(); t++) {
+                const Buffer& b = *buffers[t];
+                dropped += b.dropped;
+                const std::string name = b.thread == caller ? std::string("caller") : "worker " + std::to_string(++worker);
+                out << ",\n{\"name\":\"thread_name\",\"ph\":\"M\",\"pid\":1,\"tid\":" << t << ",\"args\":{\"name\":\"" << name << "\"}}";
+                out << ",\n{\"name\":\"thread_sort_index\",\"ph\":\"M\",\"pid\":1,\"tid\":" << t << ",\"args\":{\"sort_index\":" << (b.thread == caller ? 0 : t + 1) << "}}";
+                for (const Event& e : b.events) {
+                    const double ts = static_cast<double>(static_cast<int64_t>(e.begin - epoch)) * scale;
+                    const double dur = static_cast<double>(e.end - e.begin) * scale;
+                    out << ",\n{\"name\":\"" << e.name << "\",\"cat\":\"" << e.category << "\",\"ph\":\"X\",\"pid\":1,\"tid\":" << t << ",\"ts\":" << ts << ",\"dur\":" << dur;
+                    if (e.env >= 0) {
+                        out << ",\"args\":{\"env\":" << e.env << "}";
+                    }
+                    out << "}";
+                }
+            }
+            out << "\n],\"otherData\":{\"dropped_events\":" << dropped << "}}\n";
+            if (!out) {
+                throw std::runtime_error("Failed to write trace file " + path + ".");
+            }
+        }
+    };
+
+    // Records its lifetime as one event if tracing is on when it starts
+    class Span
+    {
+        Tracer* tracer;
+        const char* name;
+        const char* category;
+        int64_t env;
+        uint64_t begin{ 0 };
+    public:
+        Span(Tracer& tracer, const char* name, const char* category = "vec", int64_t env = -1):
+            tracer(tracer.enabled() ? &tracer : nullptr), name(name), category(category), env(env) {
+            if (this->tracer) {
+                begin = perf::now();
+            }
+        }
+        Span(const Span&) = delete;
+        Span& operator=(const Span&) = delete;
+        ~Span() {
+            if (tracer) {
+                tracer->record(name, category, env, begin, perf::now());
+            }
+        }
+    };
+}
@@ -0,0 +1,6 @@
+from slxpy.runtime.client import EnvClient
+from slxpy.runtime.server import EnvServer
+from slxpy.runtime.shm_vec_env import ShmVecEnv
+
+
+__all__ = ["EnvClient", "EnvServer", "ShmVecEnv"]
@@ -0,0 +1,122 @@
+"""
+Throughput benchmark of a built extension's GymEnv, GymEnvVec and RawEnvVec.
+
+Usage: python -m slxpy.runtime.benchmark MODULE [--batch-sizes 1,16,256,4096] [--steps 20000] [--num-threads N]
+
+Pair with "slxpy synthetic" to benchmark the runtime without MATLAB.
+"""
+import argparse
+import importlib
+import time
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+
+DEFAULT_BATCH_SIZES = (1, 16, 256, 4096)
+
+
+def _time_loop(step, iterations: int, warmup: int) -> float:
+    for _ in range(warmup):
+        step()
+    begin = time.perf_counter()
+    for _ in range(iterations):
+        step()
+    return time.perf_counter() - begin
+
+
+def bench_single(mod, steps: int, warmup: int = 100) -> float:
+    """
+    Steps per second of one GymEnv, resetting when an episode ends.
+    """
+    env = mod.GymEnv()
+    space = env.action_space
+    action = np.zeros(space.shape, space.dtype)
+    buffer = env.make_buffer()
+    env.reset(seed=0, out=buffer)
+
+    def step():
+        env.step(action, out=buffer)
+        if buffer.terminated or buffer.truncated:
+            env.reset(out=buffer)
+
+    return steps / _time_loop(step, steps, warmup)
+
+
+def bench_gym_vec(mod, batch_size: int, steps: int, num_threads: Optional[int] = None, warmup: int = 10) -> float:
+    """
+    Env steps per second of a GymEnvVec with auto reset, num_threads=1 runs envs serially.
+    """
+    spec = mod._env.EnvSpec(id="bench-v0", auto_reset=True)
+    kwargs = {} if num_threads is None else {"num_threads": num_threads}
+    env = mod.GymEnvVec(batch_size, spec, **kwargs)
+    env.seed(0)
+    space = env.single_action_space
+    action = np.zeros((batch_size, *space.shape), space.dtype)
+    buffer = env.make_buffer()
+    env.reset(out=buffer)
+    iterations = max(1, steps // batch_size)
+    return iterations * batch_size / _time_loop(lambda: env.step(action, out=buffer), iterations, warmup)
+
+
+def bench_raw_vec(mod, batch_size: int, steps: int, num_threads: Optional[int] = None, warmup: int = 10) -> float:
+    """
+    Env steps per second of a RawEnvVec, stepping the model only.
+    """
+    kwargs = {} if num_threads is None else {"num_threads": num_threads}
+    env = mod.RawEnvVec(batch_size, **kwargs)
+    env.seed(0)
+    inputs = np.zeros(batch_size, env.input_dtype)
+    outputs = np.zeros(batch_size, env.output_dtype)
+    env.reset(out=outputs)
+    iterations = max(1, steps // batch_size)
+    return iterations * batch_size / _time_loop(lambda: env.step(inputs, out=outputs), iterations, warmup)
+
+
+def run(
+    module: str,
+    batch_sizes: Iterable[int] = DEFAULT_BATCH_SIZES,
+    steps: int = 20000,
+    num_threads: Optional[int] = None,
+) -> List[dict]:
+    """
+    Measure steps per second of single, vec serial and vec parallel envs at each batch size.
+
+    Each vectorized measurement runs about `steps` env steps in total.
+    Modes missing from the extension (use_gym, use_raw, use_vec off) are skipped.
+    """
+    mod = importlib.import_module(module)
+    results = []
+    if hasattr(mod, "GymEnv"):
+        results.append({"mode": "single", "batch_size": 1, "steps_per_second": bench_single(mod, steps)})
+    for batch_size in batch_sizes:
+        if hasattr(mod, "GymEnvVec"):
+            for mode, threads in (("vec_serial", 1), ("vec_parallel", num_threads)):
+                sps = bench_gym_vec(mod, batch_size, steps, threads)
+                results.append({"mode": mode, "batch_size": batch_size, "steps_per_second": sps})
+        if hasattr(mod, "RawEnvVec"):
+            sps = bench_raw_vec(mod, batch_size, steps, num_threads)
+            results.append({"mode": "raw_vec_parallel", "batch_size": batch_size, "steps_per_second": sps})
+    return results
+
+
+def format_results(results: List[dict]) -> str:
+    lines = [f"{'mode':>18} {'batch':>7} {'steps/s':>14}"]
+    for r in results:
+        lines.append(f"{r['mode']:>18} {r['batch_size']:>7} {r['steps_per_second']:>14,.0f}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput benchmark of a slxpy extension.")
+    parser.add_argument("module", help="Name of the built extension module, must be importable.")
+    parser.add_argument("--batch-sizes", default=",".join(map(str, DEFAULT_BATCH_SIZES)))
+    parser.add_argument("--steps", type=int, default=20000, help="Env steps per measurement.")
+    parser.add_argument("--num-threads", type=int, default=None, help="Worker threads of parallel vectorized envs.")
+    args = parser.parse_args()
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",")]
+    print(format_results(run(args.module, batch_sizes, args.steps, args.num_threads)))
+
+
+if __name__ == "__main__":
+    main()
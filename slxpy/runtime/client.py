@@ -0,0 +1,145 @@
+import pickle
+from collections import deque
+from typing import Deque, Optional
+
+import numpy as np
+
+from slxpy.runtime.protocol import (
+    DEFAULT_ADDRESS,
+    FLAG_FINAL_OBS,
+    FLAG_SEED,
+    MSG_CLOSE,
+    MSG_HELLO,
+    MSG_RESET,
+    MSG_STEP,
+    NUM_ENVS,
+    SEED,
+    create_socket,
+    pack_frame,
+    parse_address,
+    recv_frame,
+)
+
+
+class EnvClient:
+    """
+    Thin client of EnvServer, used like a GymEnvVec of num_envs envs.
+
+    step(action) is a round trip. send(action) and recv() split it, so several steps can be pipelined,
+    responses are returned in request order.
+    """
+
+    def __init__(self, num_envs: int, address: str = DEFAULT_ADDRESS, timeout: Optional[float] = None):
+        family, addr = parse_address(address)
+        self.sock = create_socket(family)
+        self.sock.settimeout(timeout)
+        self.sock.connect(addr)
+        self.pending: Deque[int] = deque()
+        self.sock.sendall(pack_frame(MSG_HELLO, 0, NUM_ENVS.pack(num_envs)))
+        _, _, payload = recv_frame(self.sock)
+        handshake = pickle.loads(payload)
+        self.num_envs = num_envs
+        self.single_action_space = handshake["single_action_space"]
+        self.single_observation_space = handshake["single_observation_space"]
+        act_shape, act_dtype = handshake["act"]
+        self.act_shape = (num_envs, *act_shape)
+        self.act_dtype = np.dtype(act_dtype)
+        obs_shape, obs_dtype = handshake["obs"]
+        # Step response fields in wire order, as (name, shape, dtype)
+        self.fields = [
+            ("obs", (num_envs, *obs_shape), np.dtype(obs_dtype)),
+            ("rew", (num_envs,), np.dtype(handshake["rew"])),
+            ("terminated", (num_envs,), np.dtype(np.bool_)),
+            ("truncated", (num_envs,), np.dtype(np.bool_)),
+            *((k, (num_envs, *shape), np.dtype(dtype)) for k, shape, dtype in handshake["info"]),
+        ]
+        self.closed = False
+
+    def _split(self, payload: bytearray, flags: int):
+        offset = 0
+        values = {}
+        for name, shape, dtype in self.fields:
+            count = int(np.prod(shape))
+            values[name] = np.frombuffer(payload, dtype, count, offset).reshape(shape)
+            offset += count * dtype.itemsize
+        info = {name: values[name] for name, _, _ in self.fields[4:]}
+        if flags & FLAG_FINAL_OBS:
+            final_mask = np.frombuffer(payload, np.bool_, self.num_envs, offset)
+            offset += self.num_envs
+            _, shape, dtype = self.fields[0]
+            count = int(np.count_nonzero(final_mask))
+            info["final_obs"] = np.frombuffer(payload, dtype, count * int(np.prod(shape[1:])), offset).reshape(count, *shape[1:])
+            info["_final_obs"] = final_mask
+        return values["obs"], values["rew"], values["terminated"], values["truncated"], info
+
+    def _expect(self):
+        expected = self.pending.popleft()
+        # An error response is raised in place of the expected one
+        actual, flags, payload = recv_frame(self.sock)
+        if actual != expected:
+            raise RuntimeError(f"Unexpected response type {actual}, expecting {expected}.")
+        return flags, payload
+
+    def send(self, action: np.ndarray):
+        action = np.ascontiguousarray(action, self.act_dtype)
+        if action.shape != self.act_shape:
+            raise ValueError(f"Action array should have shape {self.act_shape}.")
+        self.sock.sendall(pack_frame(MSG_STEP, 0, action))
+        self.pending.append(MSG_STEP)
+
+    def recv(self):
+        if not self.pending:
+            raise RuntimeError("No step in flight.")
+        flags, payload = self._expect()
+        return self._split(payload, flags)
+
+    def step(self, action: np.ndarray):
+        self.send(action)
+        # Earlier pipelined steps must be received first
+        while len(self.pending) > 1:
+            self.recv()
+        return self.recv()
+
+    def reset(self, *, seed: Optional[int] = None):
+        if self.pending:
+            raise RuntimeError("Steps are still in flight, call recv before reset.")
+        if seed is None:
+            self.sock.sendall(pack_frame(MSG_RESET))
+        else:
+            self.sock.sendall(pack_frame(MSG_RESET, FLAG_SEED, SEED.pack(seed)))
+        self.pending.append(MSG_RESET)
+        _, payload = self._expect()
+        _, shape, dtype = self.fields[0]
+        return np.frombuffer(payload, dtype).reshape(shape), {}
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            while self.pending:
+                self._expect()
+            self.sock.sendall(pack_frame(MSG_CLOSE))
+            recv_frame(self.sock)
+        except (OSError, RuntimeError):
+            pass
+        finally:
+            self.sock.close()
+
+    @property
+    def unwrapped(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __del__(self):
+        if not getattr(self, "closed", True):
+            self.close()
+
+    def __repr__(self):
+        return f"<EnvClient of {self.num_envs} envs at {self.sock.getpeername()}>"
@@ -0,0 +1,113 @@
+"""
+Loopback benchmark of EnvServer and EnvClient.
+
+Usage: python -m slxpy.runtime.loopback MODULE [--clients 4] [--envs 16] [--steps 2000] [--pipeline 1]
+"""
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from slxpy.runtime.client import EnvClient
+from slxpy.runtime.server import EnvServer
+
+
+def _serve(module: str, num_envs: int, address: str, env_kwargs: dict, ready):
+    server = EnvServer(module, num_envs, address, env_kwargs=env_kwargs)
+    ready.set()
+    try:
+        server.serve_forever()
+    finally:
+        server.close()
+
+
+def _run_client(address: str, num_envs: int, steps: int, pipeline: int, start, results):
+    with EnvClient(num_envs, address) as client:
+        client.reset(seed=os.getpid())
+        action = np.zeros(client.act_shape, client.act_dtype)
+        latencies = np.empty(steps)
+        sent: List[float] = []
+        start.wait()
+        begin = time.perf_counter()
+        for i in range(steps + pipeline - 1):
+            if i < steps:
+                sent.append(time.perf_counter())
+                client.send(action)
+            if i >= pipeline - 1:
+                client.recv()
+                k = i - pipeline + 1
+                latencies[k] = time.perf_counter() - sent[k]
+        elapsed = time.perf_counter() - begin
+    results.put((latencies, elapsed))
+
+
+def run(
+    module: str,
+    clients: int = 4,
+    envs: int = 16,
+    steps: int = 2000,
+    pipeline: int = 1,
+    address: Optional[str] = None,
+    env_kwargs: Optional[dict] = None,
+) -> dict:
+    """
+    Start a server and client processes on loopback and measure round-trip latency and throughput.
+    """
+    ctx = mp.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        address = address or f"unix:{os.path.join(tmpdir, 'slxpy.sock')}"
+        ready = ctx.Event()
+        server = ctx.Process(target=_serve, args=(module, clients * envs, address, env_kwargs or {}, ready), daemon=True)
+        server.start()
+        try:
+            if not ready.wait(60):
+                raise RuntimeError("Server failed to start.")
+            start = ctx.Barrier(clients + 1)
+            results = ctx.Queue()
+            workers = [
+                ctx.Process(target=_run_client, args=(address, envs, steps, pipeline, start, results))
+                for _ in range(clients)
+            ]
+            for worker in workers:
+                worker.start()
+            start.wait()
+            outputs = [results.get() for _ in workers]
+            for worker in workers:
+                worker.join()
+        finally:
+            server.terminate()
+            server.join()
+    latencies = np.concatenate([lat for lat, _ in outputs]) * 1e6
+    elapsed = max(e for _, e in outputs)
+    return {
+        "clients": clients,
+        "envs_per_client": envs,
+        "pipeline": pipeline,
+        "latency_mean_us": float(latencies.mean()),
+        "latency_p50_us": float(np.percentile(latencies, 50)),
+        "latency_p99_us": float(np.percentile(latencies, 99)),
+        "requests_per_second": clients * steps / elapsed,
+        "env_steps_per_second": clients * envs * steps / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Loopback benchmark of slxpy env server.")
+    parser.add_argument("module", help="Name of the built extension module, must be importable.")
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--envs", type=int, default=16, help="Envs per client.")
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--pipeline", type=int, default=1, help="Steps in flight per client.")
+    parser.add_argument("--address", default=None, help="Defaults to a temporary unix socket.")
+    args = parser.parse_args()
+    stats = run(args.module, args.clients, args.envs, args.steps, args.pipeline, args.address)
+    for k, v in stats.items():
+        print(f"{k:>22}: {v:.1f}" if isinstance(v, float) else f"{k:>22}: {v}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import socket
+import struct
+from typing import Tuple, Union
+
+
+# Every frame is a fixed header followed by payload bytes.
+# Step payloads are the raw action/observation buffers in the layout sent with the handshake.
+HEADER = struct.Struct("<BBHI")  # message type, flags, reserved, payload size
+SEED = struct.Struct("<I")
+NUM_ENVS = struct.Struct("<I")
+
+MSG_HELLO = 1
+MSG_STEP = 2
+MSG_RESET = 3
+MSG_CLOSE = 4
+MSG_ERROR = 255
+
+FLAG_SEED = 1  # Reset payload carries a seed
+FLAG_FINAL_OBS = 1  # Step response carries the finished mask and observations before same-step auto reset
+
+DEFAULT_ADDRESS = "tcp:127.0.0.1:5555"
+
+Address = Union[str, Tuple[str, int]]
+
+
+def parse_address(address: str) -> Tuple[int, Address]:
+    """
+    Parse "unix:/path/to/socket", "tcp:host:port" or "host:port" into socket family and address.
+    """
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:") :]
+    if address.startswith("tcp:"):
+        address = address[len("tcp:") :]
+    host, sep, port = address.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f'Invalid address "{address}", expect "unix:PATH" or "tcp:HOST:PORT".')
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+def create_socket(family: int) -> socket.socket:
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    if family == socket.AF_INET:
+        # Frames are small and latency bound
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def recv_exact(sock: socket.socket, size: int) -> bytearray:
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:], size - received)
+        if n == 0:
+            raise ConnectionError("Connection closed by peer.")
+        received += n
+    return buf
+
+
+def recv_frame(sock: socket.socket) -> Tuple[int, int, bytearray]:
+    msg_type, flags, _, size = HEADER.unpack(recv_exact(sock, HEADER.size))
+    payload = recv_exact(sock, size) if size else bytearray()
+    if msg_type == MSG_ERROR:
+        raise RuntimeError(payload.decode())
+    return msg_type, flags, payload
+
+
+def pack_frame(msg_type: int, flags: int = 0, *parts) -> bytes:
+    size = sum(memoryview(p).nbytes for p in parts)
+    return b"".join([HEADER.pack(msg_type, flags, 0, size), *parts])
@@ -0,0 +1,341 @@
+import importlib
+import os
+import pickle
+import selectors
+import socket
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from slxpy.runtime.protocol import (
+    DEFAULT_ADDRESS,
+    FLAG_FINAL_OBS,
+    FLAG_SEED,
+    HEADER,
+    MSG_CLOSE,
+    MSG_ERROR,
+    MSG_HELLO,
+    MSG_RESET,
+    MSG_STEP,
+    NUM_ENVS,
+    SEED,
+    create_socket,
+    pack_frame,
+    parse_address,
+)
+
+
+_RECV_SIZE = 1 << 20
+_IDLE_TIMEOUT = 0.5
+
+
+class _Client:
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        self.queue: Deque[Tuple[int, int, bytes]] = deque()
+        self.offset = 0
+        self.count = 0
+        self.ids: Optional[np.ndarray] = None
+        self.reset_done = False
+        self.closing = False
+
+    @property
+    def slice(self) -> slice:
+        return slice(self.offset, self.offset + self.count)
+
+
+class EnvServer:
+    """
+    Serve one GymEnvVec of a built extension to many client processes.
+
+    Each client is assigned a contiguous range of envs at handshake.
+    Requests pending from different clients are executed as one indexed step/reset per tick,
+    so the vectorized env (and its thread pool) always sees the largest available batch.
+    Requests of one client are pipelined and answered in order.
+    """
+
+    def __init__(
+        self,
+        module: str,
+        num_envs: int,
+        address: str = DEFAULT_ADDRESS,
+        *,
+        spec: Optional[Dict[str, Any]] = None,
+        env_kwargs: Optional[Dict[str, Any]] = None,
+        batch_wait: float = 0.0,
+    ):
+        mod = importlib.import_module(module)
+        args = (num_envs,) if spec is None else (num_envs, mod._env.EnvSpec(**spec))
+        self.env = mod.GymEnvVec(*args, **(env_kwargs or {}))
+        self.num_envs = num_envs
+        self.batch_wait = batch_wait
+        self.buffer = self.env.make_buffer()
+        self.auto_reset = self.env.spec.auto_reset
+        # Envs refuse to step after done without auto reset, so such steps are rejected per client before batching
+        self.check_done = not self.auto_reset and self.env.spec.strict_reset
+        self.done = np.zeros(num_envs, dtype=bool)
+        space = self.env.single_action_space
+        self.act = np.zeros((num_envs, *space.shape), space.dtype)
+        self.info_keys = list(self.buffer.info.keys())
+        self.step_fields = [
+            self.buffer.obs,
+            self.buffer.rew,
+            self.buffer.terminated,
+            self.buffer.truncated,
+            *(self.buffer.info[k] for k in self.info_keys),
+        ]
+        self.handshake = pickle.dumps(
+            {
+                "num_envs": num_envs,
+                "single_action_space": space,
+                "single_observation_space": self.env.single_observation_space,
+                "act": (self.act.shape[1:], self.act.dtype.str),
+                "obs": (self.buffer.obs.shape[1:], self.buffer.obs.dtype.str),
+                "rew": self.buffer.rew.dtype.str,
+                "info": [(k, self.buffer.info[k].shape[1:], self.buffer.info[k].dtype.str) for k in self.info_keys],
+            }
+        )
+        self.free: List[Tuple[int, int]] = [(0, num_envs)]  # Free env ranges as (offset, count)
+
+        self.address = address
+        family, addr = parse_address(address)
+        if family == socket.AF_UNIX and os.path.exists(addr):
+            os.unlink(addr)
+        self.listener = create_socket(family)
+        if family == socket.AF_INET:
+            self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(addr)
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        self.clients: Dict[socket.socket, _Client] = {}
+        self.running = False
+
+    # Env range allocation
+    def _allocate(self, count: int) -> Optional[int]:
+        for i, (offset, size) in enumerate(self.free):
+            if size >= count:
+                self.free[i] = (offset + count, size - count)
+                return offset
+        return None
+
+    def _release(self, client: _Client):
+        if client.count == 0:
+            return
+        self.free.append((client.offset, client.count))
+        self.free.sort()
+        merged: List[Tuple[int, int]] = []
+        for offset, size in self.free:
+            if merged and merged[-1][0] + merged[-1][1] == offset:
+                merged[-1] = (merged[-1][0], merged[-1][1] + size)
+            elif size > 0:
+                merged.append((offset, size))
+        self.free = merged
+        client.count = 0
+
+    # Socket handling
+    def _accept(self):
+        sock, _ = self.listener.accept()
+        if sock.family == socket.AF_INET:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setblocking(False)
+        self.clients[sock] = _Client(sock)
+        self.selector.register(sock, selectors.EVENT_READ)
+
+    def _drop(self, client: _Client):
+        self._release(client)
+        self.selector.unregister(client.sock)
+        client.sock.close()
+        del self.clients[client.sock]
+
+    def _read(self, client: _Client):
+        try:
+            data = client.sock.recv(_RECV_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(client)
+            return
+        buf = client.inbuf
+        buf += data
+        start = 0
+        while len(buf) - start >= HEADER.size:
+            msg_type, flags, _, size = HEADER.unpack_from(buf, start)
+            end = start + HEADER.size + size
+            if len(buf) < end:
+                break
+            client.queue.append((msg_type, flags, bytes(buf[start + HEADER.size : end])))
+            start = end
+        del buf[:start]
+
+    def _write(self, client: _Client, frame: Optional[bytes] = None):
+        if frame is not None:
+            client.outbuf += frame
+        try:
+            sent = client.sock.send(client.outbuf) if client.outbuf else 0
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self._drop(client)
+            return
+        del client.outbuf[:sent]
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if client.outbuf else 0)
+        self.selector.modify(client.sock, events)
+        if client.closing and not client.outbuf:
+            self._drop(client)
+
+    def _error(self, client: _Client, message: str):
+        self._write(client, pack_frame(MSG_ERROR, 0, message.encode()))
+
+    # Request handling
+    def _hello(self, client: _Client, payload: bytes):
+        if client.count:
+            raise RuntimeError("Client already attached.")
+        (count,) = NUM_ENVS.unpack(payload)
+        offset = self._allocate(count) if count > 0 else None
+        if offset is None:
+            available = max((size for _, size in self.free), default=0)
+            raise RuntimeError(f"Cannot allocate {count} envs, {available} contiguous envs available.")
+        client.offset, client.count = offset, count
+        client.ids = np.arange(offset, offset + count, dtype=np.int64)
+        self._write(client, pack_frame(MSG_HELLO, 0, self.handshake))
+
+    def _tick(self):
+        steps: List[Tuple[_Client, bytes]] = []
+        resets: List[_Client] = []
+        for client in list(self.clients.values()):
+            if not client.queue or client.closing:
+                continue
+            msg_type, flags, payload = client.queue.popleft()
+            try:
+                if msg_type == MSG_STEP:
+                    if not client.count:
+                        raise RuntimeError("Client is not attached.")
+                    if not client.reset_done:
+                        raise RuntimeError("Calling step before reset is illegal.")
+                    if len(payload) != client.count * self.act[0].nbytes:
+                        raise RuntimeError("Action payload size mismatch.")
+                    if self.check_done and self.done[client.slice].any():
+                        raise RuntimeError("Calling step after done is illegal.")
+                    steps.append((client, payload))
+                elif msg_type == MSG_RESET:
+                    if not client.count:
+                        raise RuntimeError("Client is not attached.")
+                    if flags & FLAG_SEED:
+                        # Seeded like a vectorized env of the client's size, wherever its envs are
+                        self.env.seed(SEED.unpack(payload)[0], client.ids)
+                    resets.append(client)
+                elif msg_type == MSG_HELLO:
+                    self._hello(client, payload)
+                elif msg_type == MSG_CLOSE:
+                    client.closing = True
+                    self._write(client, pack_frame(MSG_CLOSE))
+                else:
+                    raise RuntimeError(f"Unknown message type {msg_type}.")
+            except Exception as e:
+                self._error(client, str(e))
+
+        if resets:
+            idx = np.concatenate([client.ids for client in resets])
+            try:
+                self.env.reset(idx, out=self.buffer)
+            except Exception as e:
+                for client in resets:
+                    self._error(client, str(e))
+            else:
+                self.done[idx] = False
+                for client in resets:
+                    self._reply_reset(client)
+
+        if steps:
+            clients = [client for client, _ in steps]
+            for client, payload in steps:
+                self.act[client.slice] = np.frombuffer(payload, self.act.dtype).reshape(client.count, *self.act.shape[1:])
+            try:
+                self._step(clients)
+            except Exception as e:
+                # Checks above catch the known errors. Envs of the failed batch may have advanced,
+                # so every client in it needs a reset rather than a retry that would step them twice
+                for client in clients:
+                    client.reset_done = False
+                    self._error(client, f"Step failed: {e}")
+
+    def _step(self, clients: List[_Client]):
+        idx = np.concatenate([client.ids for client in clients])
+        self.env.step(self.act, idx, out=self.buffer)
+        if self.check_done:
+            self.done[idx] = self.buffer.terminated[idx] | self.buffer.truncated[idx]
+        final_mask = self.buffer.info.get("_final_obs") if self.auto_reset else None
+        for client in clients:
+            self._reply_step(client, final_mask)
+
+    def _reply_reset(self, client: _Client):
+        client.reset_done = True
+        self._write(client, pack_frame(MSG_RESET, 0, self.buffer.obs[client.slice]))
+
+    def _reply_step(self, client: _Client, final_mask: Optional[np.ndarray]):
+        s = client.slice
+        parts = [field[s] for field in self.step_fields]
+        flags = 0
+        if final_mask is not None and final_mask[s].any():
+            # Final observations are compacted in env order, so rows of a client are contiguous
+            begin = int(np.count_nonzero(final_mask[: s.start]))
+            end = begin + int(np.count_nonzero(final_mask[s]))
+            flags = FLAG_FINAL_OBS
+            parts.append(final_mask[s])
+            parts.append(self.buffer.info["final_obs"][begin:end])
+        self._write(client, pack_frame(MSG_STEP, flags, *parts))
+
+    def serve_forever(self):
+        self.running = True
+        try:
+            while self.running:
+                pending = any(client.queue for client in self.clients.values())
+                for key, events in self.selector.select(0 if pending else _IDLE_TIMEOUT):
+                    if key.fileobj is self.listener:
+                        self._accept()
+                        continue
+                    client = self.clients.get(key.fileobj)  # type: ignore[arg-type]
+                    if client is not None and events & selectors.EVENT_WRITE:
+                        self._write(client)
+                    client = self.clients.get(key.fileobj)  # type: ignore[arg-type]
+                    if client is not None and events & selectors.EVENT_READ:
+                        self._read(client)
+                if self.batch_wait > 0 and not all(c.queue for c in self.clients.values() if c.count):
+                    # Give slower clients a chance to join the batch
+                    time.sleep(self.batch_wait)
+                    for key, events in self.selector.select(0):
+                        client = self.clients.get(key.fileobj)  # type: ignore[arg-type]
+                        if client is not None and events & selectors.EVENT_READ:
+                            self._read(client)
+                self._tick()
+        finally:
+            self.running = False
+
+    def shutdown(self):
+        self.running = False
+
+    def close(self):
+        for client in list(self.clients.values()):
+            self._drop(client)
+        self.selector.unregister(self.listener)
+        self.listener.close()
+        self.selector.close()
+        family, addr = parse_address(self.address)
+        if family == socket.AF_UNIX and os.path.exists(addr):
+            os.unlink(addr)
+        self.env.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,305 @@
+import importlib
+import multiprocessing as mp
+import signal
+import traceback
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Control block columns, one row per worker
+_CMD, _ARG, _STATUS, _DONE = range(4)
+_CMD_STEP, _CMD_RESET, _CMD_SEED, _CMD_CLOSE = range(1, 5)
+_ALIGNMENT = 64
+_POLL_INTERVAL = 1.0
+
+
+@dataclass
+class _Slot:
+    name: str
+    shape: Tuple[int, ...]
+    dtype: np.dtype
+    offset: int = 0
+
+
+def _build_layout(slots: List[_Slot]) -> int:
+    offset = 0
+    for slot in slots:
+        offset = (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+        slot.offset = offset
+        offset += int(np.prod(slot.shape, dtype=np.int64)) * slot.dtype.itemsize
+    return max(offset, 1)
+
+
+def _attach_views(buf: memoryview, slots: List[_Slot]) -> Dict[str, np.ndarray]:
+    return {slot.name: np.ndarray(slot.shape, slot.dtype, buffer=buf, offset=slot.offset) for slot in slots}
+
+
+def _worker(
+    module_name: str,
+    kind: str,
+    shm_name: str,
+    slots: List[_Slot],
+    index: int,
+    begin: int,
+    end: int,
+    spec: Optional[Dict[str, Any]],
+    env_kwargs: Dict[str, Any],
+    cmd_sem,
+    done_sem,
+    conn,
+):
+    # Interrupts are handled by the parent, which shuts workers down with _CMD_CLOSE
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Workers share the resource tracker of the parent, which owns and unlinks the block
+    shm = shared_memory.SharedMemory(name=shm_name)
+    views = _attach_views(shm.buf, slots)
+    control = views["control"][index]
+    local = {name: view[begin:end] for name, view in views.items() if name != "control"}
+    try:
+        try:
+            module = importlib.import_module(module_name)
+            if kind == "gym":
+                args = (end - begin,) if spec is None else (end - begin, module._env.EnvSpec(**spec))
+                env = module.GymEnvVec(*args, **env_kwargs)
+                # Results are written straight into the worker's rows of shared memory
+                names = ("obs", "rew", "terminated", "truncated", "final_obs", "final_mask")
+                info = {k: v for k, v in local.items() if k not in names and k not in ("act", "seeds")}
+                buffer = env.make_buffer(**{name: local[name] for name in names}, info=info)
+            else:
+                env = module.RawEnvVec(end - begin, **env_kwargs)
+            control[_STATUS] = 0
+        except Exception:
+            control[_STATUS] = 1
+            conn.send(traceback.format_exc())
+            return
+        finally:
+            done_sem.release()
+
+        while True:
+            cmd_sem.acquire()
+            cmd = control[_CMD]
+            if cmd == _CMD_CLOSE:
+                break
+            try:
+                if cmd == _CMD_STEP and kind == "gym":
+                    step_info = env.step(local["act"], out=buffer)[4]
+                    # Number of final observations, compacted to the front of the worker's rows
+                    control[_DONE] = len(step_info["final_obs"]) if "final_obs" in step_info else 0
+                elif cmd == _CMD_STEP:
+                    env.step(local["input"], out=local["output"])
+                elif cmd == _CMD_RESET and kind == "gym":
+                    env.reset(out=buffer)
+                    control[_DONE] = 0
+                elif cmd == _CMD_RESET:
+                    env.reset(out=local["output"])
+                elif cmd == _CMD_SEED:
+                    local["seeds"][:] = env.seed(int(control[_ARG]))
+                else:
+                    raise RuntimeError(f"Unknown command {cmd}.")
+                control[_STATUS] = 0
+            except Exception:
+                control[_STATUS] = 1
+                conn.send(traceback.format_exc())
+            done_sem.release()
+    finally:
+        del control, local, views
+        shm.close()
+
+
+class ShmVecEnv:
+    """
+    Vectorized env sharded over worker processes, for models that are not thread-safe.
+
+    Each worker hosts a GymEnvVec (kind="gym") or RawEnvVec (kind="raw") of the extension module
+    and exchanges data with the parent through one shared memory block, so no pickling happens per step.
+    Returned arrays are views into shared memory and are overwritten by the next call, copy them if you keep them.
+    """
+
+    def __init__(
+        self,
+        module: str,
+        num_envs: int,
+        num_workers: Optional[int] = None,
+        *,
+        kind: str = "gym",
+        spec: Optional[Dict[str, Any]] = None,
+        env_kwargs: Optional[Dict[str, Any]] = None,
+        start_method: Optional[str] = "spawn",
+    ):
+        if kind not in ("gym", "raw"):
+            raise ValueError(f'kind must be "gym" or "raw", got "{kind}".')
+        if num_workers is None:
+            num_workers = min(num_envs, mp.cpu_count())
+        if num_envs < 1 or not 1 <= num_workers <= num_envs:
+            raise ValueError("Expect num_envs >= num_workers >= 1.")
+        self.module_name = module
+        self.kind = kind
+        self.num_envs = num_envs
+        self.num_workers = num_workers
+        self.closed = True
+
+        mod = importlib.import_module(module)
+        slots = [
+            _Slot("control", (num_workers, 4), np.dtype(np.int64)),
+            _Slot("seeds", (num_envs,), np.dtype(np.uint32)),
+        ]
+        if kind == "gym":
+            env_cls = mod.GymEnvVec
+            self.single_action_space = env_cls.single_action_space
+            self.single_observation_space = env_cls.single_observation_space
+            probe = mod.StepBuffer(num_envs)
+            self._info_keys = [k for k in probe.info.keys()]
+            act_space = self.single_action_space
+            slots.append(_Slot("act", (num_envs, *act_space.shape), np.dtype(act_space.dtype)))
+            for name in ("obs", "final_obs", "final_mask", "rew", "terminated", "truncated"):
+                arr = getattr(probe, name)
+                slots.append(_Slot(name, arr.shape, arr.dtype))
+            for k in self._info_keys:
+                arr = probe.info[k]
+                slots.append(_Slot(k, arr.shape, arr.dtype))
+            del probe
+        else:
+            env_cls = mod.RawEnvVec
+            slots.append(_Slot("input", (num_envs,), env_cls.input_dtype))
+            slots.append(_Slot("output", (num_envs,), env_cls.output_dtype))
+
+        ctx = mp.get_context(start_method)
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        self._ranges = list(zip(bounds[:-1], bounds[1:]))
+        self._cmd_sems = [ctx.Semaphore(0) for _ in range(num_workers)]
+        self._done_sems = [ctx.Semaphore(0) for _ in range(num_workers)]
+        self._conns: List[Any] = []
+        self._processes: List[Any] = []
+
+        self._shm = shared_memory.SharedMemory(create=True, size=_build_layout(slots))
+        self._views = _attach_views(self._shm.buf, slots)
+        self._control = self._views["control"]
+        self._control[:] = 0
+        self._info: Dict[str, np.ndarray] = {k: self._views[k] for k in self._info_keys} if kind == "gym" else {}
+        self.closed = False
+        try:
+            self._start_workers(ctx, slots, spec, env_kwargs or {})
+            self._wait()
+        except BaseException:
+            self.close()
+            raise
+
+    def _start_workers(self, ctx, slots: List[_Slot], spec: Optional[Dict[str, Any]], env_kwargs: Dict[str, Any]):
+        for i, (begin, end) in enumerate(self._ranges):
+            parent_conn, child_conn = ctx.Pipe(duplex=False)
+            process = ctx.Process(
+                target=_worker,
+                args=(
+                    self.module_name,
+                    self.kind,
+                    self._shm.name,
+                    slots,
+                    i,
+                    int(begin),
+                    int(end),
+                    spec,
+                    env_kwargs,
+                    self._cmd_sems[i],
+                    self._done_sems[i],
+                    child_conn,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+
+    def _wait(self):
+        errors = []
+        for i, (sem, process) in enumerate(zip(self._done_sems, self._processes)):
+            while not sem.acquire(timeout=_POLL_INTERVAL):
+                if not process.is_alive():
+                    raise RuntimeError(f"Worker {i} exited unexpectedly with code {process.exitcode}.")
+            if self._control[i, _STATUS]:
+                errors.append(f"Worker {i}:\n{self._conns[i].recv()}")
+        if errors:
+            raise RuntimeError("\n".join(errors))
+
+    def _broadcast(self, cmd: int):
+        if self.closed:
+            raise RuntimeError("Env is closed.")
+        self._control[:, _CMD] = cmd
+        for sem in self._cmd_sems:
+            sem.release()
+        self._wait()
+
+    def step(self, action: np.ndarray):
+        if self.kind == "gym":
+            np.copyto(self._views["act"], action)
+        else:
+            np.copyto(self._views["input"], action)
+        self._broadcast(_CMD_STEP)
+        if self.kind == "raw":
+            return self._views["output"]
+        views, info = self._views, self._info
+        info.pop("final_obs", None)
+        info.pop("_final_obs", None)
+        counts = self._control[:, _DONE]
+        if counts.any():
+            # Gather the compacted rows of each worker to the front, keeping env order
+            final_obs, final_mask = views["final_obs"], views["final_mask"]
+            total = 0
+            for (begin, end), count in zip(self._ranges, counts):
+                if count:
+                    final_obs[total : total + count] = final_obs[begin : begin + count]
+                    total += count
+                else:
+                    final_mask[begin:end] = False
+            info["final_obs"] = final_obs[:total]
+            info["_final_obs"] = final_mask
+        return views["obs"], views["rew"], views["terminated"], views["truncated"], info
+
+    def reset(self):
+        self._broadcast(_CMD_RESET)
+        if self.kind == "raw":
+            return self._views["output"]
+        return self._views["obs"], {}
+
+    def seed(self, seed: Optional[int] = None) -> List[int]:
+        # Derive independent worker seeds, each worker then seeds its envs like GymEnvVec.seed
+        seeds = np.random.SeedSequence(seed).generate_state(self.num_workers)
+        self._control[:, _ARG] = seeds
+        self._broadcast(_CMD_SEED)
+        return self._views["seeds"].tolist()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for i, process in enumerate(self._processes):
+            if process.is_alive():
+                self._control[i, _CMD] = _CMD_CLOSE
+                self._cmd_sems[i].release()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        for conn in self._conns:
+            conn.close()
+        del self._control, self._views, self._info
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __del__(self):
+        if not getattr(self, "closed", True):
+            self.close()
+
+    def __repr__(self):
+        return f"<ShmVecEnv wrapping {self.num_envs} {self.module_name} envs in {self.num_workers} workers>"